@@ -15,16 +15,50 @@ a side-by-side comparison matrix.
 import json
 import logging
 from typing import List, Dict, Any, Union
-from services.llm_service import call_llm_async
+from config import settings
+from services.llm_service import call_llm_async, parse_llm_json
 from agents.system_prompt import COMPARISON_ROLE
 
 logger = logging.getLogger(__name__)
 
+# The system message never varies, so build the dict once instead of
+# per call.
+_SYSTEM_MESSAGE = {"role": "system", "content": COMPARISON_ROLE}
+
+# Output schema is static — built once at import instead of re-created
+# inside the f-string on every call. Byte-stable text also helps
+# provider-side prompt caching.
+_OUTPUT_SCHEMA = """{
+                    "methodology_similarities": [],
+                    "methodology_differences": [],
+                    "strengths": [],
+                    "weaknesses": [],
+                    "performance_tradeoffs": []
+                }"""
+
+# Full user-message template, assembled once at import with the schema
+# baked in. The schema's braces are doubled so the call-time .format()
+# only sees the data slot — otherwise it would treat every schema key
+# as a replacement field. Per call only the summaries slot is filled —
+# no re-building the static text on every invocation.
+_USER_TEMPLATE = """
+                Perform comparative analysis across the research papers
+                summarized below.
+
+                Return strictly valid JSON:
+
+                %s
+
+                Structured summaries:
+
+                {summaries}
+                """ % _OUTPUT_SCHEMA.replace("{", "{{").replace("}", "}}")
+
 
 class ComparisonAgent:
     """Agent for performing comparative analysis across research paper summaries."""
 
-    async def run(self, summaries: Union[List[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]:
+    async def run(self, summaries: Union[List[Dict[str, Any]], Dict[str, Any], str]) -> Dict[str, Any]:
         """
         Compare multiple research paper summaries.
 
@@ -38,39 +72,23 @@ class ComparisonAgent:
             raise ValueError("summaries cannot be empty")
 
         # Ensure summaries are serialized as a clean JSON string for the prompt
-        summaries_text = json.dumps(summaries, indent=2) if not isinstance(summaries, str) else summaries
+        summaries_text = json.dumps(summaries) if not isinstance(summaries, str) else summaries
 
         messages = [
-            {
-                "role": "system",
-                "content": COMPARISON_ROLE
-            },
+            _SYSTEM_MESSAGE,
             {
                 "role": "user",
-                "content": f"""
-                Using these structured summaries:
-
-                {summaries_text}
-
-                Perform comparative analysis across papers.
-
-                Return strictly valid JSON:
-
-                {{
-                    "methodology_similarities": [],
-                    "methodology_differences": [],
-                    "strengths": [],
-                    "weaknesses": [],
-                    "performance_tradeoffs": []
-                }}
-                """
+                "content": _USER_TEMPLATE.format(summaries=summaries_text)
             }
         ]
 
-        response = await call_llm_async(messages, max_tokens=1500)
+        response = await call_llm_async(
+            messages, max_tokens=1200, json_mode=True,
+            model=settings.LLM_MODEL_FAST
+        )
 
         try:
-            return json.loads(response)
+            return parse_llm_json(response)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse LLM response: {str(e)}")
             return {"error": "Invalid JSON", "raw_output": response}
\ No newline at end of file
@@ -0,0 +1,130 @@
+"""
+Comparison + Insight Agent — fused comparative analysis and insights.
+
+WHY TWO RESPONSIBILITIES IN ONE AGENT:
+Same reasoning as NoveltyTrendAgent (novelty + trend): ComparisonAgent
+and InsightAgent consume EXACTLY the same input — the structured
+summaries — and sit together at the root of the agent DAG, so running
+them separately meant two LLM calls each carrying its own copy of the
+multi-KB summaries payload. Fusing them halves the calls and duplicated
+prompt tokens for this pair, and shortens the DAG's critical path: gap
+analysis now waits for one fused call instead of the slower of two.
+The two outputs stay independent — the orchestrator still assembles
+them into their own walkthrough sections (4: Comparison Table,
+6: Deep Insights).
+
+The standalone ComparisonAgent and InsightAgent remain available for
+callers that only need one of the two analyses.
+"""
+
+import json
+import logging
+from typing import Dict, Any
+from config import settings
+from services.llm_service import call_llm_async, parse_llm_json
+from agents.system_prompt import COMPARISON_INSIGHT_ROLE
+
+logger = logging.getLogger(__name__)
+
+# The system message never varies, so build the dict once instead of
+# per call.
+_SYSTEM_MESSAGE = {"role": "system", "content": COMPARISON_INSIGHT_ROLE}
+
+# Output schema is static — built once at import. The two sub-objects
+# mirror the standalone ComparisonAgent and InsightAgent schemas exactly,
+# so downstream consumers of either section see an unchanged shape.
+_OUTPUT_SCHEMA = """{
+    "comparison": {
+        "methodology_similarities": [],
+        "methodology_differences": [],
+        "strengths": [],
+        "weaknesses": [],
+        "performance_tradeoffs": []
+    },
+    "insights": {
+        "unique_methods": [],
+        "common_datasets": [],
+        "evaluation_metrics": [],
+        "recurring_limitations": [],
+        "emerging_themes": []
+    }
+}"""
+
+# Full user-message template, assembled once at import with the schema
+# baked in — braces doubled so the call-time .format() only sees the
+# summaries slot. Static instructions come FIRST and variable data LAST
+# so the prompt shares a stable prefix across calls.
+_USER_TEMPLATE = """From the structured summaries below, perform comparative analysis across the papers AND extract cross-paper insights.
+
+For the comparison, identify methodology similarities, differences,
+strengths, weaknesses, and performance tradeoffs.
+
+For the insights, extract:
+
+1. Unique methods used across papers
+2. Common datasets used
+3. Frequently used evaluation metrics
+4. Recurring limitations
+5. Emerging research themes
+
+Return strictly valid JSON:
+
+%s
+
+JSON only. No markdown. No explanations.
+
+Structured summaries:
+
+{summaries}""" % _OUTPUT_SCHEMA.replace("{", "{{").replace("}", "}}")
+
+_COMPARISON_FALLBACK = {"error": "Unable to parse comparison"}
+_INSIGHTS_FALLBACK = {"error": "Unable to parse insights"}
+
+
+class ComparisonInsightAgent:
+    """Compares papers and extracts cross-paper insights in one LLM call."""
+
+    async def run(self, summaries: Any) -> Dict[str, Any]:
+        """
+        Run the fused comparison + insight analysis.
+
+        Args:
+            summaries: Structured summaries from SummarizerAgent
+                (or a pre-serialized JSON string from the orchestrator)
+
+        Returns:
+            Dict with "comparison" and "insights" keys, each matching the
+            standalone agent's output shape
+        """
+        if not summaries:
+            raise ValueError("summaries cannot be empty")
+
+        summaries_text = json.dumps(summaries) if not isinstance(summaries, str) else summaries
+
+        messages = [
+            _SYSTEM_MESSAGE,
+            {
+                "role": "user",
+                "content": _USER_TEMPLATE.format(summaries=summaries_text)
+            }
+        ]
+
+        response = await call_llm_async(
+            messages, max_tokens=2400, json_mode=True,
+            model=settings.LLM_MODEL_FAST
+        )
+
+        try:
+            parsed = parse_llm_json(response)
+        except json.JSONDecodeError as e:
+            logger.error(f"Comparison+insight agent parse failed: {e}")
+            return {
+                "comparison": dict(_COMPARISON_FALLBACK),
+                "insights": dict(_INSIGHTS_FALLBACK),
+                "raw_output": response
+            }
+
+        return {
+            "comparison": parsed.get("comparison", dict(_COMPARISON_FALLBACK)),
+            "insights": parsed.get("insights", dict(_INSIGHTS_FALLBACK))
+        }
@@ -20,11 +20,59 @@ This combined output maps to TWO walkthrough sections:
 import json
 import logging
 from typing import Dict, Any
-from services.llm_service import call_llm_async
+from services.llm_service import call_llm_async, parse_llm_json
 from agents.system_prompt import CRITIQUE_ROLE
 
 logger = logging.getLogger(__name__)
 
+# The system message never varies, so build the dict once instead of
+# per call.
+_SYSTEM_MESSAGE = {"role": "system", "content": CRITIQUE_ROLE}
+
+# Output schema is static — built once at import instead of re-created
+# inside the f-string (with brace escaping) on every call.
+_OUTPUT_SCHEMA = """{
+    "scientific_critique": {
+        "strong_points": [
+            {"aspect": "<what>", "detail": "<why it's strong>"}
+        ],
+        "weak_points": [
+            {"aspect": "<what>", "detail": "<why it's weak>", "severity": "minor|moderate|major"}
+        ],
+        "experimental_design_assessment": "<brief assessment>",
+        "reproducibility_assessment": "<brief assessment>",
+        "statistical_validity": "<brief assessment>",
+        "dataset_quality": "<brief assessment>"
+    },
+    "argument_strength": [
+        {
+            "claim": "<extracted claim>",
+            "evidence_strength": "strong|moderate|weak",
+            "reliability": "high|medium|low",
+            "missing_evidence": "<what's needed to strengthen this>",
+            "bias_indicators": "<any bias detected or 'none'>"
+        }
+    ]
+}"""
+
+# Full user-message template, assembled once at import with the schema
+# baked in. The schema's braces are doubled so the call-time .format()
+# only sees the data slots. Per call only the two data slots are filled.
+_USER_TEMPLATE = """Critique the research papers provided below and evaluate argument strength.
+
+Provide two analyses in strictly valid JSON:
+
+%s
+
+Extract at least 5 claims for argument analysis.
+JSON only. No markdown.
+
+=== PAPER SUMMARIES ===
+{summaries}
+
+=== COMPARATIVE ANALYSIS ===
+{comparison}""" % _OUTPUT_SCHEMA.replace("{", "{{").replace("}", "}}")
+
 
 class CritiqueAgent:
     """Critiques research methodology and evaluates argument strength."""
@@ -44,59 +92,24 @@ class CritiqueAgent:
         Returns:
             Dict with strong_points, weak_points, and argument_strength_table
         """
-        summaries_text = json.dumps(summaries, indent=2) if not isinstance(summaries, str) else summaries
-        comparison_text = json.dumps(comparison, indent=2) if not isinstance(comparison, str) else comparison
+        summaries_text = json.dumps(summaries) if not isinstance(summaries, str) else summaries
+        comparison_text = json.dumps(comparison) if not isinstance(comparison, str) else comparison
 
         messages = [
-            {
-                "role": "system",
-                "content": CRITIQUE_ROLE
-            },
+            _SYSTEM_MESSAGE,
             {
                 "role": "user",
-                "content": f"""Critique these research papers and evaluate argument strength:
-
-=== PAPER SUMMARIES ===
-{summaries_text}
-
-=== COMPARATIVE ANALYSIS ===
-{comparison_text}
-
-Provide two analyses in strictly valid JSON:
-
-{{
-    "scientific_critique": {{
-        "strong_points": [
-            {{"aspect": "<what>", "detail": "<why it's strong>"}}
-        ],
-        "weak_points": [
-            {{"aspect": "<what>", "detail": "<why it's weak>", "severity": "minor|moderate|major"}}
-        ],
-        "experimental_design_assessment": "<brief assessment>",
-        "reproducibility_assessment": "<brief assessment>",
-        "statistical_validity": "<brief assessment>",
-        "dataset_quality": "<brief assessment>"
-    }},
-    "argument_strength": [
-        {{
-            "claim": "<extracted claim>",
-            "evidence_strength": "strong|moderate|weak",
-            "reliability": "high|medium|low",
-            "missing_evidence": "<what's needed to strengthen this>",
-            "bias_indicators": "<any bias detected or 'none'>"
-        }}
-    ]
-}}
-
-Extract at least 5 claims for argument analysis.
-JSON only. No markdown."""
+                "content": _USER_TEMPLATE.format(
+                    summaries=summaries_text,
+                    comparison=comparison_text
+                )
             }
         ]
 
-        response = await call_llm_async(messages, max_tokens=2500)
+        response = await call_llm_async(messages, max_tokens=2500, json_mode=True)
 
         try:
-            return json.loads(response)
+            return parse_llm_json(response)
         except json.JSONDecodeError as e:
             logger.error(f"Critique agent parse failed: {e}")
             return {
@@ -20,11 +20,51 @@ and the Researcher Roadmap (Section 11).
 import json
 import logging
 from typing import Dict, Any
-from services.llm_service import call_llm_async
+from services.llm_service import call_llm_async, parse_llm_json
 from agents.system_prompt import GAP_ROLE
 
 logger = logging.getLogger(__name__)
 
+# The system message never varies, so build the dict once instead of
+# per call.
+_SYSTEM_MESSAGE = {"role": "system", "content": GAP_ROLE}
+
+# Output schema is static — built once at import instead of re-created
+# inside the f-string on every call.
+_OUTPUT_SCHEMA = """{
+                    "repeated_limitations": [],
+                    "underexplored_combinations": [],
+                    "missing_benchmarks": [],
+                    "conflicting_findings": [],
+                    "novel_research_directions": []
+                }"""
+
+# Full user-message template, assembled once at import with the schema
+# baked in. The schema's braces are doubled so the call-time .format()
+# only sees the data slots. Per call only the three data slots are
+# filled.
+_USER_TEMPLATE = """
+                Perform research gap analysis on the structured research
+                data below.
+
+                Return strictly valid JSON in this format:
+
+                %s
+
+                Do NOT include markdown.
+                Do NOT include explanations.
+                JSON only.
+
+                === SUMMARIES ===
+                {summaries}
+
+                === COMPARISON ===
+                {comparison}
+
+                === INSIGHTS ===
+                {insights}
+                """ % _OUTPUT_SCHEMA.replace("{", "{{").replace("}", "}}")
+
 
 class GapDetectionAgent:
     """Agent for detecting research gaps and unexplored opportunities."""
@@ -41,52 +81,26 @@ class GapDetectionAgent:
         Returns:
             Dict with gap categories or error dict
         """
-        summaries_text = json.dumps(summaries, indent=2)
-        comparison_text = json.dumps(comparison, indent=2)
-        insights_text = json.dumps(insights, indent=2)
+        summaries_text = json.dumps(summaries) if not isinstance(summaries, str) else summaries
+        comparison_text = json.dumps(comparison) if not isinstance(comparison, str) else comparison
+        insights_text = json.dumps(insights) if not isinstance(insights, str) else insights
 
         messages = [
-            {
-                "role": "system",
-                "content": GAP_ROLE
-            },
+            _SYSTEM_MESSAGE,
             {
                 "role": "user",
-                "content": f"""
-                Using the following structured research data:
-
-                === SUMMARIES ===
-                {summaries_text}
-
-                === COMPARISON ===
-                {comparison_text}
-
-                === INSIGHTS ===
-                {insights_text}
-
-                Perform research gap analysis.
-
-                Return strictly valid JSON in this format:
-
-                {{
-                    "repeated_limitations": [],
-                    "underexplored_combinations": [],
-                    "missing_benchmarks": [],
-                    "conflicting_findings": [],
-                    "novel_research_directions": []
-                }}
-
-                Do NOT include markdown.
-                Do NOT include explanations.
-                JSON only.
-                """
+                "content": _USER_TEMPLATE.format(
+                    summaries=summaries_text,
+                    comparison=comparison_text,
+                    insights=insights_text
+                )
             }
         ]
 
-        response = await call_llm_async(messages, max_tokens=2000)
+        response = await call_llm_async(messages, max_tokens=2000, json_mode=True)
 
         try:
-            parsed = json.loads(response)
+            parsed = parse_llm_json(response)
             return parsed
         except json.JSONDecodeError as e:
             logger.error(f"Gap agent parse failed: {e}")
@@ -16,21 +16,62 @@ when reading papers one at a time.
 import json
 import logging
 from typing import List, Dict, Any, Union
-from services.llm_service import call_llm_async
+from config import settings
+from services.llm_service import call_llm_async, parse_llm_json
 from agents.system_prompt import INSIGHT_ROLE
 
 logger = logging.getLogger(__name__)
 
+# The system message never varies, so build the dict once instead of
+# per call.
+_SYSTEM_MESSAGE = {"role": "system", "content": INSIGHT_ROLE}
+
+# Output schema is static — built once at import instead of re-created
+# inside the f-string on every call.
+_OUTPUT_SCHEMA = """{
+                    "unique_methods": [],
+                    "common_datasets": [],
+                    "evaluation_metrics": [],
+                    "recurring_limitations": [],
+                    "emerging_themes": []
+                }"""
+
+# Full user-message template, assembled once at import with the schema
+# baked in. The schema's braces are doubled so the call-time .format()
+# only sees the data slot. Per call only the summaries slot is filled.
+_USER_TEMPLATE = """
+                From the structured summaries below, extract:
+
+                1. Unique methods used across papers
+                2. Common datasets used
+                3. Frequently used evaluation metrics
+                4. Recurring limitations
+                5. Emerging research themes
+
+                Return strictly valid JSON in this format:
+
+                %s
+
+                Do NOT include explanations.
+                Do NOT include markdown.
+                JSON only.
+
+                Structured summaries:
+
+                {summaries}
+                """ % _OUTPUT_SCHEMA.replace("{", "{{").replace("}", "}}")
+
 
 class InsightAgent:
     """Agent for extracting cross-paper insights from research summaries."""
 
-    async def run(self, summaries: Union[List[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]:
+    async def run(self, summaries: Union[List[Dict[str, Any]], Dict[str, Any], str]) -> Dict[str, Any]:
         """
         Extract cross-paper insights from structured summaries.
 
         Args:
             summaries: Structured summaries from SummarizerAgent
+                (or a pre-serialized JSON string from the orchestrator)
 
         Returns:
             Dict with extracted insights or error dict
@@ -38,50 +79,24 @@ class InsightAgent:
         if not summaries:
             raise ValueError("summaries cannot be empty")
 
-        # Convert summaries to string safely
-        summaries_text = json.dumps(summaries, indent=2)
+        # Convert summaries to string safely (skip if already serialized)
+        summaries_text = json.dumps(summaries) if not isinstance(summaries, str) else summaries
 
         messages = [
-            {
-                "role": "system",
-                "content": INSIGHT_ROLE
-            },
+            _SYSTEM_MESSAGE,
             {
                 "role": "user",
-                "content": f"""
-                Using the following structured summaries:
-
-                {summaries_text}
-
-                Extract:
-
-                1. Unique methods used across papers
-                2. Common datasets used
-                3. Frequently used evaluation metrics
-                4. Recurring limitations
-                5. Emerging research themes
-
-                Return strictly valid JSON in this format:
-
-                {{
-                    "unique_methods": [],
-                    "common_datasets": [],
-                    "evaluation_metrics": [],
-                    "recurring_limitations": [],
-                    "emerging_themes": []
-                }}
-
-                Do NOT include explanations.
-                Do NOT include markdown.
-                JSON only.
-                """
+                "content": _USER_TEMPLATE.format(summaries=summaries_text)
             }
         ]
 
-        response = await call_llm_async(messages, max_tokens=1500)
+        response = await call_llm_async(
+            messages, max_tokens=1200, json_mode=True,
+            model=settings.LLM_MODEL_FAST
+        )
 
         try:
-            parsed = json.loads(response)
+            parsed = parse_llm_json(response)
             return parsed
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse LLM response: {str(e)}")
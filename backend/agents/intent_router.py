@@ -8,19 +8,20 @@ Not every query needs all 11 agents. For example:
 - "What's the latest in NLP?" → needs trends, literature, maybe skip gap analysis
 
 HOW IT WORKS NOW:
-For v4.0, the full pipeline always runs (all agents activated). The intent
-router classifies the query type for logging/explainability but doesn't
-yet selectively skip agents. This is the foundation for future selective routing.
+Classification is a local keyword-rule pass — no LLM call. The query
+types are coarse and keyword-separable, so an LLM round-trip (formerly
+the first serial step of every pipeline run) bought nothing over a
+deterministic lookup that runs in microseconds and can't fail or
+rate-limit. The full pipeline still always runs (all agents activated);
+the classification feeds logging/explainability and is the foundation
+for future selective routing.
 
 FUTURE:
 Will use the classification to skip irrelevant agents, saving LLM tokens and time.
 """
 
-import json
 import logging
 from typing import Dict, Any, List
-from services.llm_service import call_llm_async
-from agents.system_prompt import INTENT_ROUTER_ROLE
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,35 @@ ALL_AGENTS = [
     "knowledge_graph"
 ]
 
+# Keyword rules checked in order — first match wins. Keywords are matched
+# against the lowercased query, so multi-word phrases work too.
+_QUERY_TYPE_RULES = [
+    ("comparison", (
+        "compare", "comparison", " vs ", " vs.", "versus",
+        "difference between", "better than", "side by side",
+    )),
+    ("gap_analysis", (
+        "gap", "missing", "unexplored", "understudied", "open problem",
+        "not been done", "limitations of",
+    )),
+    ("trend_analysis", (
+        "trend", "future", "forecast", "emerging", "latest",
+        "state of the art", "where is the field",
+    )),
+    ("critique", (
+        "critique", "criticize", "criticise", "weakness", "flaw",
+        "how rigorous", "reproducib",
+    )),
+    ("roadmap", (
+        "roadmap", "research plan", "learning path", "where do i start",
+        "how do i start", "get started", "study plan",
+    )),
+    ("exploration", (
+        "overview", "survey", "introduction", "what is", "explain",
+        "tell me about",
+    )),
+]
+
 
 class IntentRouter:
     """Routes user queries to appropriate agent(s)."""
@@ -52,38 +82,19 @@ class IntentRouter:
         Returns:
             Dict with query_type, intent, and list of agents to activate
         """
-        messages = [
-            {
-                "role": "system",
-                "content": INTENT_ROUTER_ROLE
-            },
-            {
-                "role": "user",
-                "content": f"""Classify this research query:
-
-"{query}"
-
-Return JSON:
-{{
-    "query_type": "exploration|comparison|gap_analysis|trend_analysis|critique|roadmap|general",
-    "intent": "<one-line description of what the user wants>",
-    "primary_focus": "<main topic>"
-}}
-
-JSON only."""
-            }
-        ]
-
-        try:
-            response = await call_llm_async(messages, max_tokens=500)
-            classification = json.loads(response)
-        except Exception as e:
-            logger.warning(f"Intent classification failed: {e}, defaulting to general")
-            classification = {
-                "query_type": "general",
-                "intent": query,
-                "primary_focus": query
-            }
+        query_lower = query.lower()
+
+        query_type = "general"
+        for candidate, keywords in _QUERY_TYPE_RULES:
+            if any(keyword in query_lower for keyword in keywords):
+                query_type = candidate
+                break
+
+        classification = {
+            "query_type": query_type,
+            "intent": query,
+            "primary_focus": query
+        }
 
         # For v4.0: always activate all agents (full pipeline)
         # Future versions will selectively route based on query_type
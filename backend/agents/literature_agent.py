@@ -6,13 +6,47 @@ from agents.system_prompt import LITERATURE_ROLE
 
 logger = logging.getLogger(__name__)
 
+# The system message never varies, so build the dict once instead of
+# per call.
+_SYSTEM_MESSAGE = {"role": "system", "content": LITERATURE_ROLE}
+
+# Full user-message template, assembled once at import. Per call only
+# the four data slots are filled.
+_USER_TEMPLATE = """
+                From the structured research data below, generate a
+                structured literature review with the following sections:
+
+                1. Background
+                2. Taxonomy of Approaches
+                3. Comparative Discussion
+                4. Key Limitations
+                5. Identified Research Gaps
+                6. Future Work Directions
+
+                Return clean markdown format.
+                Do NOT include citations.
+                Do NOT mention that you are an AI.
+
+                === SUMMARIES ===
+                {summaries}
+
+                === COMPARISON ===
+                {comparison}
+
+                === INSIGHTS ===
+                {insights}
+
+                === GAPS ===
+                {gaps}
+                """
+
 
 class LiteratureReviewAgent:
     """Agent for generating a structured academic literature review from research analysis outputs."""
 
     async def run(
         self,
-        summaries: Union[List[Dict[str, Any]], Dict[str, Any]],
+        summaries: Union[List[Dict[str, Any]], Dict[str, Any], str],
         comparison: Dict[str, Any],
         insights: Dict[str, Any],
         gaps: Dict[str, Any]
@@ -38,51 +72,30 @@ class LiteratureReviewAgent:
         if not gaps:
             raise ValueError("gaps cannot be empty")
 
-        summaries_text = json.dumps(summaries, indent=2)
-        comparison_text = json.dumps(comparison, indent=2)
-        insights_text = json.dumps(insights, indent=2)
-        gaps_text = json.dumps(gaps, indent=2)
+        summaries_text = json.dumps(summaries) if not isinstance(summaries, str) else summaries
+        comparison_text = json.dumps(comparison) if not isinstance(comparison, str) else comparison
+        insights_text = json.dumps(insights) if not isinstance(insights, str) else insights
+        gaps_text = json.dumps(gaps) if not isinstance(gaps, str) else gaps
 
         messages = [
-            {
-                "role": "system",
-                "content": LITERATURE_ROLE
-            },
+            _SYSTEM_MESSAGE,
             {
                 "role": "user",
-                "content": f"""
-                Using the following structured research data:
-
-                === SUMMARIES ===
-                {summaries_text}
-
-                === COMPARISON ===
-                {comparison_text}
-
-                === INSIGHTS ===
-                {insights_text}
-
-                === GAPS ===
-                {gaps_text}
-
-                Generate a structured literature review with the following sections:
-
-                1. Background
-                2. Taxonomy of Approaches
-                3. Comparative Discussion
-                4. Key Limitations
-                5. Identified Research Gaps
-                6. Future Work Directions
-
-                Return clean markdown format.
-                Do NOT include citations.
-                Do NOT mention that you are an AI.
-                """
+                "content": _USER_TEMPLATE.format(
+                    summaries=summaries_text,
+                    comparison=comparison_text,
+                    insights=insights_text,
+                    gaps=gaps_text
+                )
             }
         ]
 
         try:
-            response = await call_llm_async(messages, max_tokens=4000)
+            # Longest generation in the pipeline (4000 tokens of
+            # markdown) — consume it as a stream so tokens flow as they
+            # are produced instead of the provider buffering the full
+            # review, and transport errors surface at the failing token.
+            response = await call_llm_async(messages, max_tokens=4000, stream=True)
             return response.strip()
         except Exception as e:
             logger.error(f"Literature review generation failed: {str(e)}")
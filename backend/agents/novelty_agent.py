@@ -17,11 +17,50 @@ The score helps researchers decide: "Is this worth pursuing?"
 import json
 import logging
 from typing import Dict, Any
-from services.llm_service import call_llm_async
+from services.llm_service import call_llm_async, parse_llm_json
 from agents.system_prompt import NOVELTY_ROLE
 
 logger = logging.getLogger(__name__)
 
+# Output schema is static — built once at import instead of re-created
+# inside the f-string (with brace escaping) on every call.
+_OUTPUT_SCHEMA = """{
+    "overall_score": <weighted average 0-100>,
+    "uniqueness_score": <0-100>,
+    "scientific_novelty_score": <0-100>,
+    "practical_novelty_score": <0-100>,
+    "redundancy_risk_score": <0-100>,
+    "opportunity_score": <0-100>,
+    "explanation": "<2-3 sentence justification>",
+    "opportunity_areas": ["<area 1>", "<area 2>", "<area 3>"]
+}"""
+
+# Full user-message template, assembled once at import with the schema
+# baked in. The schema's braces are doubled so the call-time .format()
+# only sees the query/data slots, which are all that is filled per call.
+_USER_TEMPLATE = """Evaluate the novelty of the research query below against the existing work provided.
+
+Score the research on these dimensions (0-100 each):
+
+1. uniqueness_score: How different from existing approaches?
+2. scientific_novelty_score: Does it advance theory?
+3. practical_novelty_score: New real-world applications?
+4. redundancy_risk_score: Overlap with existing work? (100 = NO redundancy, 0 = fully redundant)
+5. opportunity_score: Room for extension and new work?
+
+Return strictly valid JSON:
+%s
+
+JSON only. No markdown.
+
+QUERY: {query}
+
+=== EXISTING PAPER SUMMARIES ===
+{summaries}
+
+=== CROSS-PAPER INSIGHTS ===
+{insights}""" % _OUTPUT_SCHEMA.replace("{", "{{").replace("}", "}}")
+
 
 class NoveltyAgent:
     """Scores research novelty on a 0-100 scale with breakdown."""
@@ -43,8 +82,8 @@ class NoveltyAgent:
         Returns:
             Dict with overall score, sub-scores, and explanation
         """
-        summaries_text = json.dumps(summaries, indent=2) if not isinstance(summaries, str) else summaries
-        insights_text = json.dumps(insights, indent=2) if not isinstance(insights, str) else insights
+        summaries_text = json.dumps(summaries) if not isinstance(summaries, str) else summaries
+        insights_text = json.dumps(insights) if not isinstance(insights, str) else insights
 
         messages = [
             {
@@ -53,44 +92,18 @@ class NoveltyAgent:
             },
             {
                 "role": "user",
-                "content": f"""Evaluate the novelty of this research query against existing work:
-
-QUERY: {query}
-
-=== EXISTING PAPER SUMMARIES ===
-{summaries_text}
-
-=== CROSS-PAPER INSIGHTS ===
-{insights_text}
-
-Score the research on these dimensions (0-100 each):
-
-1. uniqueness_score: How different from existing approaches?
-2. scientific_novelty_score: Does it advance theory?
-3. practical_novelty_score: New real-world applications?
-4. redundancy_risk_score: Overlap with existing work? (100 = NO redundancy, 0 = fully redundant)
-5. opportunity_score: Room for extension and new work?
-
-Return strictly valid JSON:
-{{
-    "overall_score": <weighted average 0-100>,
-    "uniqueness_score": <0-100>,
-    "scientific_novelty_score": <0-100>,
-    "practical_novelty_score": <0-100>,
-    "redundancy_risk_score": <0-100>,
-    "opportunity_score": <0-100>,
-    "explanation": "<2-3 sentence justification>",
-    "opportunity_areas": ["<area 1>", "<area 2>", "<area 3>"]
-}}
-
-JSON only. No markdown."""
+                "content": _USER_TEMPLATE.format(
+                    query=query,
+                    summaries=summaries_text,
+                    insights=insights_text
+                )
             }
         ]
 
-        response = await call_llm_async(messages, max_tokens=1500)
+        response = await call_llm_async(messages, max_tokens=1000, json_mode=True)
 
         try:
-            return json.loads(response)
+            return parse_llm_json(response)
         except json.JSONDecodeError as e:
             logger.error(f"Novelty agent parse failed: {e}")
             return {
@@ -0,0 +1,140 @@
+"""
+Novelty + Trend Agent — fused novelty scoring and trend forecasting.
+
+WHY TWO RESPONSIBILITIES IN ONE AGENT:
+Same reasoning as CritiqueAgent (critique + argument strength):
+NoveltyAgent and TrendAgent consume EXACTLY the same inputs
+(query, summaries, insights), so running them separately meant two LLM
+calls carrying two copies of the same multi-KB context. Fusing them
+halves the calls and the duplicated prompt tokens for this pair while
+keeping the two outputs independent — the orchestrator still assembles
+them into their own walkthrough sections (7: Novelty Score,
+8: Trend Forecast).
+
+The standalone NoveltyAgent and TrendAgent remain available for callers
+that only need one of the two analyses.
+"""
+
+import json
+import logging
+from typing import Dict, Any
+from services.llm_service import call_llm_async, parse_llm_json
+from agents.system_prompt import NOVELTY_TREND_ROLE
+
+logger = logging.getLogger(__name__)
+
+# The system message never varies, so build the dict once instead of
+# per call.
+_SYSTEM_MESSAGE = {"role": "system", "content": NOVELTY_TREND_ROLE}
+
+# Output schema is static — built once at import. The two sub-objects
+# mirror the standalone NoveltyAgent and TrendAgent schemas exactly, so
+# downstream consumers of either section see an unchanged shape.
+_OUTPUT_SCHEMA = """{
+    "novelty": {
+        "overall_score": <weighted average 0-100>,
+        "uniqueness_score": <0-100>,
+        "scientific_novelty_score": <0-100>,
+        "practical_novelty_score": <0-100>,
+        "redundancy_risk_score": <0-100>,
+        "opportunity_score": <0-100>,
+        "explanation": "<2-3 sentence justification>",
+        "opportunity_areas": ["<area 1>", "<area 2>", "<area 3>"]
+    },
+    "trend": {
+        "current_research_direction": "<description of where the field is now>",
+        "method_adoption_trends": [
+            {"method": "<name>", "trend": "rising|stable|declining", "reason": "<why>"}
+        ],
+        "emerging_tools_and_frameworks": [
+            {"name": "<tool/framework>", "impact": "<expected impact>"}
+        ],
+        "citation_pattern_insights": "<what citation patterns reveal>",
+        "one_year_predictions": ["<prediction 1>", "<prediction 2>", "<prediction 3>"],
+        "three_year_predictions": ["<prediction 1>", "<prediction 2>", "<prediction 3>"],
+        "rising_topics": ["<topic 1>", "<topic 2>"],
+        "declining_topics": ["<topic 1>", "<topic 2>"],
+        "cross_domain_opportunities": ["<opportunity 1>", "<opportunity 2>"]
+    }
+}"""
+
+_NOVELTY_FALLBACK = {
+    "overall_score": 50,
+    "explanation": "Unable to parse novelty assessment"
+}
+_TREND_FALLBACK = {"error": "Unable to parse trend analysis"}
+
+
+class NoveltyTrendAgent:
+    """Scores novelty and forecasts trends in a single LLM call."""
+
+    async def run(
+        self,
+        query: str,
+        summaries: Any,
+        insights: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Run the fused novelty + trend analysis.
+
+        Args:
+            query: The user's research question
+            summaries: Paper summaries from SummarizerAgent
+            insights: Cross-paper insights from InsightAgent
+
+        Returns:
+            Dict with "novelty" and "trend" keys, each matching the
+            standalone agent's output shape
+        """
+        summaries_text = json.dumps(summaries) if not isinstance(summaries, str) else summaries
+        insights_text = json.dumps(insights) if not isinstance(insights, str) else insights
+
+        messages = [
+            _SYSTEM_MESSAGE,
+            {
+                "role": "user",
+                "content": f"""Evaluate the novelty of the research query below against the existing work provided, AND analyze research trends for the same topic.
+
+For novelty, score these dimensions (0-100 each):
+
+1. uniqueness_score: How different from existing approaches?
+2. scientific_novelty_score: Does it advance theory?
+3. practical_novelty_score: New real-world applications?
+4. redundancy_risk_score: Overlap with existing work? (100 = NO redundancy, 0 = fully redundant)
+5. opportunity_score: Room for extension and new work?
+
+For trends, cover: current direction, method adoption, emerging tools,
+citation patterns, 1-year and 3-year predictions, rising/declining
+topics, and cross-domain opportunities.
+
+Return strictly valid JSON:
+{_OUTPUT_SCHEMA}
+
+JSON only. No markdown.
+
+QUERY: {query}
+
+=== EXISTING PAPER SUMMARIES ===
+{summaries_text}
+
+=== CROSS-PAPER INSIGHTS ===
+{insights_text}"""
+            }
+        ]
+
+        response = await call_llm_async(messages, max_tokens=2500, json_mode=True)
+
+        try:
+            parsed = parse_llm_json(response)
+        except json.JSONDecodeError as e:
+            logger.error(f"Novelty+trend agent parse failed: {e}")
+            return {
+                "novelty": dict(_NOVELTY_FALLBACK),
+                "trend": dict(_TREND_FALLBACK),
+                "raw_output": response
+            }
+
+        return {
+            "novelty": parsed.get("novelty", dict(_NOVELTY_FALLBACK)),
+            "trend": parsed.get("trend", dict(_TREND_FALLBACK))
+        }
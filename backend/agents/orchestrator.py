@@ -8,38 +8,42 @@ or combine their outputs. The orchestrator:
 
 1. SEARCHES for papers (paper_search service)
 2. CHAINS agents in dependency order (e.g., gap analysis needs summaries first)
-3. PARALLELIZES where safe (comparison + insight don't depend on each other)
+3. PARALLELIZES where safe (critique + knowledge_graph don't depend on each other)
 4. TIMES every step for the explainability log
 5. ASSEMBLES the final 16-section output that matches the walkthrough format
 6. COMPUTES a confidence score based on data availability
 7. GRACEFULLY DEGRADES — if one agent fails, it logs the error and continues
    with fallback results instead of crashing the entire pipeline
 
-PIPELINE DEPENDENCY GRAPH:
-    papers → summarizer → comparison → gap → literature
-                       → insight    → gap
-                       → kg_builder
-    query + summaries + insights → novelty, trend, roadmap
-    summaries + comparison → critique
+PIPELINE DEPENDENCY GRAPH (DAG, each node starts when its deps land):
+    papers → summarizer → summaries
+    summaries → comparison_insight (fused comparison + insight call)
+    comparison_insight → critique, knowledge_graph, novelty_trend, gap
+    gap → roadmap
+    comparison_insight + gap → literature
     all outputs → 16-section assembly
 """
 
 import asyncio
+import hashlib
 import json
 import time
 import logging
-from typing import Dict, Any, List
+from collections import OrderedDict
+from contextlib import contextmanager
+from graphlib import TopologicalSorter
+from itertools import chain
+from typing import Dict, Any, Iterator, List
 
+from config import settings
 from services.paper_search import search_papers, PaperResult
 from services.knowledge_graph import KnowledgeGraphBuilder
-from services.llm_service import call_llm_async
+from services.llm_service import call_llm_async, dumps_compact
 from agents.summarizer_agent import SummarizerAgent
-from agents.comparison_agent import ComparisonAgent
-from agents.insight_agent import InsightAgent
+from agents.comparison_insight_agent import ComparisonInsightAgent
 from agents.gap_agent import GapDetectionAgent
 from agents.literature_agent import LiteratureReviewAgent
-from agents.novelty_agent import NoveltyAgent
-from agents.trend_agent import TrendAgent
+from agents.novelty_trend_agent import NoveltyTrendAgent
 from agents.critique_agent import CritiqueAgent
 from agents.roadmap_agent import RoadmapAgent
 from agents.intent_router import IntentRouter
@@ -47,6 +51,127 @@ from agents.system_prompt import ORCHESTRATOR_IDENTITY, FINAL_ANSWER_ROLE
 
 logger = logging.getLogger(__name__)
 
+# Whole-pipeline result cache. A pipeline run is ~10 LLM calls, so a
+# repeated query (same user retrying, classmates researching the same
+# topic) is worth short-circuiting entirely. Keys are whitespace/case
+# normalized queries — an embedding-based semantic cache would catch
+# paraphrases too, but this tree has no embedding stack and exact
+# repeats are the common case. TTL keeps trend/novelty sections from
+# going stale.
+_PIPELINE_CACHE_TTL_SECONDS = 3600
+_PIPELINE_CACHE_MAX_ENTRIES = 64
+_pipeline_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+def _normalize_query(query: str) -> str:
+    """Canonical cache key: lowercase, single-spaced."""
+    return " ".join(query.lower().split())
+
+
+# Confidence scoring tables — declarative so the weights and wording
+# live in one place instead of being buried in an if/elif cascade.
+# Paper coverage tiers: (min_papers, points, reason), first match wins.
+_PAPER_COVERAGE_TIERS = (
+    (8, 30, "Strong paper coverage (8+ papers)"),
+    (5, 20, "Moderate paper coverage (5-7 papers)"),
+    (2, 10, "Limited paper coverage (2-4 papers)"),
+    (0, 5, "Minimal paper coverage (1 paper)"),
+)
+
+# Component checks: (check, points_if_ok, reason_if_ok, reason_if_not).
+# Failed checks score the 5-point floor.
+_COMPONENT_RULES = (
+    (lambda ctx: ctx["summaries_ok"], 20,
+     "Summaries generated successfully", "Summary generation had issues"),
+    (lambda ctx: ctx["comparison_ok"], 20,
+     "Comparison analysis complete", "Comparison had issues"),
+    (lambda ctx: ctx["insights_ok"], 15,
+     "Cross-paper insights extracted", "Insight extraction had issues"),
+    (lambda ctx: ctx["gaps_ok"], 15,
+     "Gap analysis complete", "Gap analysis had issues"),
+)
+
+_COMPONENT_FLOOR_POINTS = 5
+
+
+# The agent dependency topology, declared once. Adding an agent means
+# adding one entry here and one factory in _build_dag — the scheduler
+# derives all parallelism from this table. Validated at import:
+# TopologicalSorter.prepare() raises CycleError immediately if an edit
+# ever introduces a cycle, failing startup loudly instead of deadlocking
+# the first request.
+_DAG_DEPS = {
+    "comparison_insight": (),
+    "gap": ("comparison_insight",),
+    "knowledge_graph": ("comparison_insight",),
+    "novelty_trend": ("comparison_insight",),
+    "critique": ("comparison_insight",),
+    "roadmap": ("gap",),
+    "literature": ("comparison_insight", "gap"),
+}
+TopologicalSorter(_DAG_DEPS).prepare()
+
+# Per-agent fallback results, defined once instead of being rebuilt as
+# inline literals on every failure path. _run_dag hands out shallow
+# copies so a caller mutating its result can't corrupt the template.
+_AGENT_FALLBACKS = {
+    "comparison_insight": {
+        "comparison": {"error": "Comparison failed"},
+        "insights": {"error": "Insight extraction failed"},
+    },
+    "gap": {"error": "Gap analysis failed"},
+    "knowledge_graph": {"node_count": 0, "edge_count": 0, "error": "KG build failed"},
+    "novelty_trend": {
+        "novelty": {"overall_score": 0, "explanation": "Novelty scoring failed"},
+        "trend": {"error": "Trend analysis failed"},
+    },
+    "critique": {
+        "scientific_critique": {"strong_points": [], "weak_points": []},
+        "argument_strength": [],
+    },
+    "roadmap": {"error": "Roadmap generation failed"},
+    "literature": "Literature review generation failed",
+}
+
+# Failures we degrade gracefully from: LLM transport/retry exhaustion
+# (RuntimeError from llm_service), malformed agent inputs (ValueError),
+# unparseable LLM output (json.JSONDecodeError) and timeouts. Anything
+# else — including CancelledError — propagates, so programming errors
+# aren't masked as "agent had issues" and cooperative cancellation
+# still works.
+_DEGRADABLE_ERRORS = (RuntimeError, ValueError, json.JSONDecodeError, asyncio.TimeoutError)
+
+# Agents and the graph builder are stateless (their only "state" is the
+# role prompt baked into module constants, and the builder works on a
+# local graph per build), so one instance per process serves every
+# request — no reason to pay 11 object constructions per query.
+_intent_router = IntentRouter()
+_kg_builder = KnowledgeGraphBuilder()
+_summarizer = SummarizerAgent()
+_comparison_insight_agent = ComparisonInsightAgent()
+_gap_agent = GapDetectionAgent()
+_novelty_trend_agent = NoveltyTrendAgent()
+_critique_agent = CritiqueAgent()
+_roadmap_agent = RoadmapAgent()
+_literature_agent = LiteratureReviewAgent()
+
+
+
+@contextmanager
+def _timed(timing_log: Dict[str, int], name: str):
+    """
+    Record a step's duration into timing_log as raw perf_counter_ns.
+
+    Monotonic (NTP steps can make time.time() go backward) and stored
+    as an int — conversion to seconds happens once at assembly instead
+    of paying round() per step.
+    """
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        timing_log[name] = time.perf_counter_ns() - start
+
 
 class AgentOrchestrator:
     """Master controller that chains all agents into a 16-section pipeline."""
@@ -61,25 +186,33 @@ class AgentOrchestrator:
         Returns:
             Dict containing all 16 sections of the output format
         """
-        pipeline_start = time.time()
-        timing_log = {}
+        pipeline_start = time.perf_counter_ns()
+        timing_log: Dict[str, int] = {}  # raw ns, converted at assembly
         agents_activated = []
 
+        # Whole-pipeline cache check — a hit skips every LLM call
+        cache_key = _normalize_query(query)
+        cached = _pipeline_cache.get(cache_key)
+        if cached is not None:
+            cached_at, cached_result = cached
+            if time.time() - cached_at < _PIPELINE_CACHE_TTL_SECONDS:
+                _pipeline_cache.move_to_end(cache_key)
+                logger.info(f"Pipeline cache hit for query: {query!r}")
+                return cached_result
+            del _pipeline_cache[cache_key]
+
         # ========================================
         # STEP 1: Intent Classification
         # ========================================
-        step_start = time.time()
-        intent_router = IntentRouter()
-        intent = await intent_router.classify(query)
-        timing_log["intent_classification"] = round(time.time() - step_start, 2)
+        with _timed(timing_log, "intent_classification"):
+            intent = await _intent_router.classify(query)
         agents_activated.append("intent_router")
 
         # ========================================
         # STEP 2: Paper Search (arXiv + PubMed)
         # ========================================
-        step_start = time.time()
-        paper_results: List[PaperResult] = await search_papers(query)
-        timing_log["paper_search"] = round(time.time() - step_start, 2)
+        with _timed(timing_log, "paper_search"):
+            paper_results: List[PaperResult] = await search_papers(query)
 
         if not paper_results:
             return self._empty_result(query, "No papers found for this query")
@@ -90,163 +223,110 @@ class AgentOrchestrator:
         # ========================================
         # STEP 3: Summarizer Agent
         # ========================================
-        step_start = time.time()
-        summarizer = SummarizerAgent()
-        try:
-            summaries = await summarizer.run(papers_for_agents)
-        except Exception as e:
-            logger.error(f"Summarizer agent failed: {e}")
-            summaries = {"error": f"Summarizer failed: {str(e)}"}
-        timing_log["summarizer"] = round(time.time() - step_start, 2)
+        with _timed(timing_log, "summarizer"):
+            try:
+                summaries = await _summarizer.run(papers_for_agents)
+            except _DEGRADABLE_ERRORS as e:
+                logger.error(f"Summarizer agent failed: {e}")
+                summaries = {"error": f"Summarizer failed: {str(e)}"}
         agents_activated.append("summarizer")
 
-        # ========================================
-        # STEP 4: Comparison + Insight (PARALLEL)
-        # These don't depend on each other, only on summaries.
-        # Running them in parallel saves ~50% of this step's time.
-        #
-        # GRACEFUL DEGRADATION: return_exceptions=True means if one
-        # fails, the other still completes. We check each result.
-        # ========================================
-        step_start = time.time()
-        comparison_agent = ComparisonAgent()
-        insight_agent = InsightAgent()
-
-        results = await asyncio.gather(
-            comparison_agent.run(summaries),
-            insight_agent.run(summaries),
-            return_exceptions=True
-        )
-
-        # Handle comparison result
-        if isinstance(results[0], Exception):
-            logger.error(f"Comparison agent failed: {results[0]}")
-            comparison = {"error": f"Comparison failed: {str(results[0])}"}
-        else:
-            comparison = results[0]
-
-        # Handle insight result
-        if isinstance(results[1], Exception):
-            logger.error(f"Insight agent failed: {results[1]}")
-            insights = {"error": f"Insight extraction failed: {str(results[1])}"}
-        else:
-            insights = results[1]
+        # Drop duplicate summaries before anything downstream sees them.
+        # arXiv and PubMed can return the same paper, and the summarizer
+        # then emits near-identical entries — every duplicate is paid for
+        # again in every agent prompt.
+        summaries = self._dedupe_summaries(summaries)
 
-        timing_log["comparison_and_insight"] = round(time.time() - step_start, 2)
-        agents_activated.extend(["comparison", "insight"])
+        # Serialize summaries ONCE. Every downstream agent embeds the same
+        # JSON string in its prompt — re-serializing the same dict 6+ times
+        # wasted CPU (and allocations) on the event loop thread. Agents
+        # accept either the raw structure or a pre-serialized string.
+        # The payload is bounded so a large paper set can't blow past the
+        # model's context window (which fails every downstream agent at once).
+        summaries_text = self._bound_summaries_text(summaries)
 
         # ========================================
-        # STEP 5: Gap Analysis
-        # Depends on: summaries, comparison, insights
-        # ========================================
-        step_start = time.time()
-        gap_agent = GapDetectionAgent()
-        try:
-            gaps = await gap_agent.run(summaries, comparison, insights)
-        except Exception as e:
-            logger.error(f"Gap agent failed: {e}")
-            gaps = {"error": f"Gap analysis failed: {str(e)}"}
-        timing_log["gap_analysis"] = round(time.time() - step_start, 2)
-        agents_activated.append("gap")
-
-        # ========================================
-        # STEP 6: Knowledge Graph + Novelty + Trend + Critique + Roadmap (PARALLEL)
-        # These are all independent of each other. Run them concurrently.
+        # STEP 4: Agent DAG (comparison_insight → critique/kg/novelty/gap,
+        #         gap → roadmap/literature)
+        # The post-summarizer agents form a dependency DAG, not a line.
+        # Hand-wired "waves" (the old layout) forced every agent to
+        # wait for the slowest member of the previous wave even when its
+        # own inputs were already available — e.g. critique only needs
+        # the comparison, and the roadmap only needs gaps. The DAG
+        # runner starts each agent the instant its dependencies land,
+        # so end-to-end latency is the critical path, not the sum of waves.
         #
-        # GRACEFUL DEGRADATION: Each result is checked individually.
-        # If novelty fails but roadmap succeeds, the user still gets a roadmap.
+        # GRACEFUL DEGRADATION: a failed node is replaced by its fallback
+        # and downstream nodes still run with that fallback as input.
         # ========================================
-        step_start = time.time()
-
-        kg_builder = KnowledgeGraphBuilder()
-        novelty_agent = NoveltyAgent()
-        trend_agent = TrendAgent()
-        critique_agent = CritiqueAgent()
-        roadmap_agent = RoadmapAgent()
-
-        parallel_results = await asyncio.gather(
-            kg_builder.build(summaries, insights),
-            novelty_agent.run(query, summaries, insights),
-            trend_agent.run(query, summaries, insights),
-            critique_agent.run(summaries, comparison),
-            roadmap_agent.run(query, summaries, gaps),
-            return_exceptions=True
+        with _timed(timing_log, "agent_dag"):
+            agent_results: Dict[str, Any] = {}
+            dag = self._build_dag(query, summaries_text, agent_results)
+            await self._run_dag(dag, agent_results, timing_log)
+
+        # Split the fused comparison+insight result into its two sections
+        comparison_insight = agent_results["comparison_insight"]
+        comparison = comparison_insight.get("comparison", {"error": "Comparison failed"})
+        insights = comparison_insight.get("insights", {"error": "Insight extraction failed"})
+
+        gaps = agent_results["gap"]
+        kg_result = agent_results["knowledge_graph"]
+        novelty_trend = agent_results["novelty_trend"]
+        critique = agent_results["critique"]
+        roadmap = agent_results["roadmap"]
+        literature_review = agent_results["literature"]
+
+        # Split the fused novelty+trend result into its two sections
+        novelty = novelty_trend.get("novelty", {"overall_score": 0, "explanation": "Novelty scoring failed"})
+        trend = novelty_trend.get("trend", {"error": "Trend analysis failed"})
+
+        agents_activated.extend(
+            ["comparison_insight", "gap", "knowledge_graph", "novelty",
+             "trend", "critique", "roadmap", "literature"]
         )
 
-        # Unpack with fallbacks
-        agent_names = ["knowledge_graph", "novelty", "trend", "critique", "roadmap"]
-        fallbacks = [
-            {"node_count": 0, "edge_count": 0, "error": "KG build failed"},
-            {"overall_score": 0, "explanation": "Novelty scoring failed"},
-            {"error": "Trend analysis failed"},
-            {"scientific_critique": {"strong_points": [], "weak_points": []}, "argument_strength": []},
-            {"error": "Roadmap generation failed"},
-        ]
-
-        kg_result, novelty, trend, critique, roadmap = [
-            fallbacks[i] if isinstance(r, Exception) else r
-            for i, r in enumerate(parallel_results)
-        ]
-
-        # Log any failures
-        for i, r in enumerate(parallel_results):
-            if isinstance(r, Exception):
-                logger.error(f"{agent_names[i]} agent failed: {r}")
-
-        timing_log["parallel_agents"] = round(time.time() - step_start, 2)
-        agents_activated.extend(agent_names)
-
-        # ========================================
-        # STEP 7: Literature Review
-        # Depends on: summaries, comparison, insights, gaps
-        # ========================================
-        step_start = time.time()
-        literature_agent = LiteratureReviewAgent()
-        try:
-            literature_review = await literature_agent.run(summaries, comparison, insights, gaps)
-        except Exception as e:
-            logger.error(f"Literature agent failed: {e}")
-            literature_review = f"Literature review generation failed: {str(e)}"
-        timing_log["literature_review"] = round(time.time() - step_start, 2)
-        agents_activated.append("literature")
-
         # ========================================
         # STEP 7.5: Final Simplified Answer
         # A clean, layperson-readable synthesis of all outputs.
         # ========================================
-        step_start = time.time()
-        try:
-            final_answer = await self._generate_final_answer(
-                query, summaries, comparison, insights, gaps,
-                novelty, trend, literature_review
-            )
-        except Exception as e:
-            logger.error(f"Final answer generation failed: {e}")
-            final_answer = "Unable to generate simplified answer."
-        timing_log["final_answer"] = round(time.time() - step_start, 2)
+        with _timed(timing_log, "final_answer"):
+            try:
+                final_answer = await self._generate_final_answer(
+                    query, summaries, comparison, insights, gaps,
+                    novelty, trend, literature_review
+                )
+            except _DEGRADABLE_ERRORS as e:
+                logger.error(f"Final answer generation failed: {e}")
+                final_answer = "Unable to generate simplified answer."
         agents_activated.append("final_answer_synthesizer")
 
         # ========================================
         # STEP 8: Assemble 16-Section Output
         # ========================================
-        pipeline_time = round(time.time() - pipeline_start, 2)
+        pipeline_time = round((time.perf_counter_ns() - pipeline_start) / 1e9, 2)
+
+        # One conversion pass — steps store raw ints until here
+        timing_breakdown = {k: round(v / 1e9, 2) for k, v in timing_log.items()}
 
         # Compute confidence score based on data quality
         confidence = self._compute_confidence(
             paper_results, summaries, comparison, insights, gaps
         )
 
-        # Build paper context with URLs
-        paper_context = [
-            {
+        # Build paper context with URLs and per-source counts in a single
+        # pass (the counts were previously two extra scans of the list).
+        paper_context = []
+        arxiv_count = pubmed_count = 0
+        for p in paper_results:
+            paper_context.append({
                 "title": p.title,
                 "authors": p.authors,
                 "url": p.url,
                 "source": p.source,
-                "abstract": p.abstract[:200] + "..." if len(p.abstract) > 200 else p.abstract
-            }
-            for p in paper_results
-        ]
+                "abstract": p.abstract if len(p.abstract) <= 200 else p.abstract[:200] + "..."
+            })
+            arxiv_count += p.source == "arxiv"
+            pubmed_count += p.source == "pubmed"
 
         # Extract recommended methods/datasets from insights + gaps
         recommended = self._extract_recommendations(insights, gaps)
@@ -261,8 +341,7 @@ class AgentOrchestrator:
                 "query": query,
                 "intent": intent,
                 "papers_found": len(paper_results),
-                "sources": {"arxiv": sum(1 for p in paper_results if p.source == "arxiv"),
-                            "pubmed": sum(1 for p in paper_results if p.source == "pubmed")}
+                "sources": {"arxiv": arxiv_count, "pubmed": pubmed_count}
             },
 
             # Section 2: Context Summary
@@ -317,12 +396,12 @@ class AgentOrchestrator:
             "explainability_log": {
                 "agents_activated": agents_activated,
                 "total_agents": len(agents_activated),
-                "timing_breakdown": timing_log,
+                "timing_breakdown": timing_breakdown,
                 "total_pipeline_time_seconds": pipeline_time,
                 "routing_strategy": intent.get("routing_strategy", "full_pipeline"),
                 "reasoning_summary": (
                     f"Searched arXiv and PubMed for '{query}', found {len(paper_results)} papers. "
-                    f"Summarized all papers, then ran comparison and insight analysis in parallel. "
+                    f"Summarized all papers, then ran comparison and insight analysis in one fused call. "
                     f"Detected research gaps, built knowledge graph with {kg_result.get('node_count', 0)} nodes, "
                     f"scored novelty at {novelty.get('overall_score', 'N/A')}/100, "
                     f"forecasted trends, critiqued methodologies, and generated a 30-day roadmap. "
@@ -332,8 +411,192 @@ class AgentOrchestrator:
             }
         }
 
+        # Store for repeated queries (empty results were returned earlier
+        # and are never cached — a transient search failure shouldn't be
+        # replayed for an hour)
+        _pipeline_cache[cache_key] = (time.time(), result)
+        _pipeline_cache.move_to_end(cache_key)
+        while len(_pipeline_cache) > _PIPELINE_CACHE_MAX_ENTRIES:
+            _pipeline_cache.popitem(last=False)
+
         return result
 
+    def _build_dag(
+        self,
+        query: str,
+        summaries_text: str,
+        results: Dict[str, Any]
+    ) -> Dict[str, tuple]:
+        """
+        Build the post-summarizer agent DAG.
+
+        Each node maps to a zero-arg coro factory, invoked only after
+        every dependency declared in _DAG_DEPS has landed in `results`,
+        so factories can safely read dependency outputs from it.
+        If a node raises, its entry in _AGENT_FALLBACKS replaces the
+        result, keeping downstream nodes runnable (graceful degradation).
+        """
+        # Serialize each intermediate output at most once, however many
+        # dependents consume it (the comparison section feeds 3 agents,
+        # the insights section 4). Compact separators: prompt whitespace
+        # is tokenized and billed.
+        serialized: Dict[str, str] = {}
+
+        def text_of(name: str) -> str:
+            if name not in serialized:
+                serialized[name] = dumps_compact(results[name])
+            return serialized[name]
+
+        def part_of(name: str, key: str) -> str:
+            # One section of a fused node's result (e.g. just the
+            # comparison from comparison_insight), serialized once.
+            memo_key = f"{name}.{key}"
+            if memo_key not in serialized:
+                serialized[memo_key] = dumps_compact(results[name].get(key, {}))
+            return serialized[memo_key]
+
+        return {
+            "comparison_insight": lambda: _comparison_insight_agent.run(summaries_text),
+            "gap": lambda: _gap_agent.run(
+                summaries_text,
+                part_of("comparison_insight", "comparison"),
+                part_of("comparison_insight", "insights")
+            ),
+            "knowledge_graph": lambda: _kg_builder.build(
+                summaries_text, part_of("comparison_insight", "insights")
+            ),
+            "novelty_trend": lambda: _novelty_trend_agent.run(
+                query, summaries_text, part_of("comparison_insight", "insights")
+            ),
+            "critique": lambda: _critique_agent.run(
+                summaries_text, part_of("comparison_insight", "comparison")
+            ),
+            "roadmap": lambda: _roadmap_agent.run(
+                query, summaries_text, text_of("gap")
+            ),
+            "literature": lambda: _literature_agent.run(
+                summaries_text, part_of("comparison_insight", "comparison"),
+                part_of("comparison_insight", "insights"), text_of("gap")
+            ),
+        }
+
+    async def _run_dag(
+        self,
+        dag: Dict[str, tuple],
+        results: Dict[str, Any],
+        timing_log: Dict[str, float]
+    ) -> None:
+        """
+        Execute the agent DAG, starting each node as soon as its
+        dependencies complete.
+
+        Uses graphlib's TopologicalSorter for readiness tracking and
+        asyncio.wait(FIRST_COMPLETED) for dispatch, so a slow node only
+        delays its own dependents — independent branches keep flowing.
+        Per-node wall time is recorded into timing_log.
+        """
+        sorter = TopologicalSorter(_DAG_DEPS)
+        sorter.prepare()
+
+        running: Dict[asyncio.Task, str] = {}
+        started_at: Dict[str, float] = {}
+
+        while sorter.is_active():
+            for name in sorter.get_ready():
+                started_at[name] = time.perf_counter_ns()
+                # wait_for bounds each agent's wall clock — a hung LLM
+                # call times out into that agent's fallback instead of
+                # stalling every dependent node
+                running[asyncio.ensure_future(
+                    asyncio.wait_for(dag[name](), timeout=settings.AGENT_TIMEOUT_SECONDS)
+                )] = name
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = running.pop(task)
+                exc = task.exception()
+                if exc is not None:
+                    if not isinstance(exc, _DEGRADABLE_ERRORS):
+                        # Programming error — don't mask it as degradation
+                        for other in running:
+                            other.cancel()
+                        raise exc
+                    logger.error(f"{name} agent failed: {exc}")
+                    fallback = _AGENT_FALLBACKS[name]
+                    results[name] = dict(fallback) if isinstance(fallback, dict) else fallback
+                else:
+                    results[name] = task.result()
+                timing_log[name] = time.perf_counter_ns() - started_at[name]
+                logger.info(
+                    f"Agent '{name}' finished in {timing_log[name] / 1e9:.2f}s "
+                    f"({len(results)}/{len(dag)} complete)"
+                )
+                sorter.done(name)
+
+    def _dedupe_summaries(self, summaries: Any) -> Any:
+        """
+        Remove duplicate per-paper summaries, keeping first occurrence.
+
+        Entries are compared by a content hash of their canonical JSON,
+        so reordered keys still count as duplicates. Non-list payloads
+        (error dicts) pass through untouched.
+        """
+        if not isinstance(summaries, list):
+            return summaries
+
+        seen = set()
+        unique = []
+        for entry in summaries:
+            digest = hashlib.blake2b(
+                json.dumps(entry, sort_keys=True).encode("utf-8"),
+                digest_size=16
+            ).hexdigest()
+            if digest not in seen:
+                seen.add(digest)
+                unique.append(entry)
+
+        if len(unique) < len(summaries):
+            logger.info(
+                f"Dropped {len(summaries) - len(unique)} duplicate summaries "
+                f"({len(unique)} remain)"
+            )
+        return unique
+
+    def _bound_summaries_text(self, summaries: Any) -> str:
+        """
+        Serialize summaries under the configured prompt character budget.
+
+        For a list of per-paper summaries, whole entries are kept until
+        the budget is reached, so the prompt always contains valid JSON
+        for complete papers rather than a document truncated mid-field.
+        Non-list payloads (error dicts) are hard-truncated — they're
+        small in practice and only truncated if malformed.
+        """
+        budget = settings.PROMPT_CHAR_BUDGET
+        text = dumps_compact(summaries)
+
+        if len(text) <= budget:
+            return text
+
+        if not isinstance(summaries, list):
+            return text[:budget]
+
+        # Keep whole papers, serialized once each, until the budget fills
+        parts = []
+        used = 2  # brackets
+        for entry in summaries:
+            piece = dumps_compact(entry)
+            if parts and used + len(piece) + 2 > budget:
+                break
+            parts.append(piece)
+            used += len(piece) + 2
+
+        logger.warning(
+            f"Summaries payload exceeded prompt budget — "
+            f"keeping {len(parts)}/{len(summaries)} papers"
+        )
+        return "[" + ", ".join(parts) + "]"
+
     def _compute_confidence(
         self,
         papers: List[PaperResult],
@@ -345,65 +608,37 @@ class AgentOrchestrator:
         """
         Compute confidence score (0-100) based on data quality.
 
-        Scoring breakdown:
+        Scoring breakdown (weights live in the module-level tables):
         - Papers found: 0-30 points (more papers = more evidence)
         - Summaries quality: 0-20 points
         - Comparison depth: 0-20 points
         - Insights richness: 0-15 points
         - Gap detection: 0-15 points
         """
-        score = 0
-        reasons = []
+        # Evaluate each component's health once, then let the tables
+        # accumulate points and reasons.
+        ctx = {
+            "summaries_ok": isinstance(summaries, list) and len(summaries) > 0,
+            "comparison_ok": isinstance(comparison, dict) and "error" not in comparison,
+            "insights_ok": isinstance(insights, dict) and "error" not in insights,
+            "gaps_ok": isinstance(gaps, dict) and "error" not in gaps,
+        }
 
-        # Paper count (30 points max)
         paper_count = len(papers)
-        if paper_count >= 8:
-            score += 30
-            reasons.append("Strong paper coverage (8+ papers)")
-        elif paper_count >= 5:
-            score += 20
-            reasons.append("Moderate paper coverage (5-7 papers)")
-        elif paper_count >= 2:
-            score += 10
-            reasons.append("Limited paper coverage (2-4 papers)")
-        else:
-            score += 5
-            reasons.append("Minimal paper coverage (1 paper)")
-
-        # Summaries quality (20 points)
-        if isinstance(summaries, list) and len(summaries) > 0:
-            score += 20
-            reasons.append("Summaries generated successfully")
-        elif isinstance(summaries, dict) and "error" not in summaries:
-            score += 15
-            reasons.append("Summaries generated with minor issues")
-        else:
-            score += 5
-            reasons.append("Summary generation had issues")
-
-        # Comparison depth (20 points)
-        if isinstance(comparison, dict) and "error" not in comparison:
-            score += 20
-            reasons.append("Comparison analysis complete")
-        else:
-            score += 5
-            reasons.append("Comparison had issues")
-
-        # Insights richness (15 points)
-        if isinstance(insights, dict) and "error" not in insights:
-            score += 15
-            reasons.append("Cross-paper insights extracted")
-        else:
-            score += 5
-            reasons.append("Insight extraction had issues")
-
-        # Gap detection (15 points)
-        if isinstance(gaps, dict) and "error" not in gaps:
-            score += 15
-            reasons.append("Gap analysis complete")
-        else:
-            score += 5
-            reasons.append("Gap analysis had issues")
+        score, reasons = 0, []
+        for min_papers, points, reason in _PAPER_COVERAGE_TIERS:
+            if paper_count >= min_papers:
+                score += points
+                reasons.append(reason)
+                break
+
+        for check, points, reason_ok, reason_bad in _COMPONENT_RULES:
+            if check(ctx):
+                score += points
+                reasons.append(reason_ok)
+            else:
+                score += _COMPONENT_FLOOR_POINTS
+                reasons.append(reason_bad)
 
         return {
             "score": min(score, 100),
@@ -425,22 +660,31 @@ class AgentOrchestrator:
             "evaluation_metrics": metrics
         }
 
+    @staticmethod
+    def _format_gap_items(prefix: str, items: List) -> "Iterator[str]":
+        """
+        Yield prefixed suggestion strings from one gap list.
+
+        Kept as a generator so the two gap lists flatten into the result
+        without intermediate lists. The per-item type check stays: LLM
+        output lists aren't guaranteed homogeneous, so dispatching once
+        on the first element could mis-format the rest.
+        """
+        for item in items:
+            if isinstance(item, str):
+                yield f"{prefix}{item}"
+            elif isinstance(item, dict):
+                yield f"{prefix}{item.get('description', str(item))}"
+
     def _extract_experiments(self, gaps: Dict) -> List[str]:
         """Extract experiment suggestions from gap analysis."""
-        experiments = []
-
-        if isinstance(gaps, dict):
-            for direction in gaps.get("novel_research_directions", []):
-                if isinstance(direction, str):
-                    experiments.append(f"Experiment: {direction}")
-                elif isinstance(direction, dict):
-                    experiments.append(f"Experiment: {direction.get('description', str(direction))}")
+        if not isinstance(gaps, dict):
+            return ["No specific experiments suggested — gap data was limited"]
 
-            for combo in gaps.get("underexplored_combinations", []):
-                if isinstance(combo, str):
-                    experiments.append(f"Explore: {combo}")
-                elif isinstance(combo, dict):
-                    experiments.append(f"Explore: {combo.get('description', str(combo))}")
+        experiments = list(chain(
+            self._format_gap_items("Experiment: ", gaps.get("novel_research_directions", [])),
+            self._format_gap_items("Explore: ", gaps.get("underexplored_combinations", [])),
+        ))
 
         return experiments if experiments else ["No specific experiments suggested — gap data was limited"]
 
@@ -495,13 +739,13 @@ Final Simplified Answer in 2-3 paragraphs that a layperson can understand.
 Cover: (1) what this research area is about, (2) key findings from the
 analysis, and (3) what a researcher should do next.
 
-{context_text}
+Write plain English. No JSON. No bullet points. Just 2-3 clear paragraphs.
 
-Write plain English. No JSON. No bullet points. Just 2-3 clear paragraphs."""
+{context_text}"""
             }
         ]
 
-        return await call_llm_async(messages, max_tokens=1000)
+        return await call_llm_async(messages, max_tokens=800)
 
     def _empty_result(self, query: str, reason: str) -> Dict[str, Any]:
         """Return a structured empty result when pipeline can't proceed."""
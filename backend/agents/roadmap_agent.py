@@ -16,11 +16,73 @@ so the researcher has everything they need to get started.
 import json
 import logging
 from typing import Dict, Any
-from services.llm_service import call_llm_async
+from services.llm_service import call_llm_async, parse_llm_json
 from agents.system_prompt import ROADMAP_ROLE
 
 logger = logging.getLogger(__name__)
 
+# The system message never varies, so build the dict once instead of
+# per call.
+_SYSTEM_MESSAGE = {"role": "system", "content": ROADMAP_ROLE}
+
+# Output schema is static — built once at import instead of re-created
+# inside the f-string (with brace escaping) on every call.
+_OUTPUT_SCHEMA = """{
+    "roadmap": {
+        "week_1": {
+            "theme": "Foundations & Literature Review",
+            "tasks": ["<task 1>", "<task 2>", "<task 3>"],
+            "resources": ["<resource 1>", "<resource 2>"]
+        },
+        "week_2": {
+            "theme": "Technical Deep Dive",
+            "tasks": ["<task 1>", "<task 2>", "<task 3>"],
+            "resources": ["<resource 1>", "<resource 2>"]
+        },
+        "week_3": {
+            "theme": "Experimental Work",
+            "tasks": ["<task 1>", "<task 2>", "<task 3>"],
+            "resources": ["<resource 1>", "<resource 2>"]
+        },
+        "week_4": {
+            "theme": "Synthesis & Write-up",
+            "tasks": ["<task 1>", "<task 2>", "<task 3>"],
+            "resources": ["<resource 1>", "<resource 2>"]
+        }
+    },
+    "project_ideas": [
+        {"title": "<project>", "difficulty": "beginner|intermediate|advanced", "description": "<brief>"}
+    ],
+    "recommended_datasets": [
+        {"name": "<dataset>", "description": "<what it contains>", "url": "<if known>"}
+    ],
+    "baseline_models": [
+        {"name": "<model>", "description": "<what it does>", "implementation": "<where to find>"}
+    ],
+    "key_papers_to_read": ["<paper title 1>", "<paper title 2>", "<paper title 3>"]
+}"""
+
+# Full user-message template, assembled once at import with the schema
+# baked in — braces doubled so the call-time .format() only sees the
+# query/data slots. Static instructions come FIRST and variable data
+# LAST so the prompt shares a stable prefix across calls (provider-side
+# prompt caching keys on the prefix).
+_USER_TEMPLATE = """Create a 30-day researcher roadmap for the topic given below.
+
+Return strictly valid JSON:
+%s
+
+Provide at least 5 project ideas, 5 datasets, and 3 baseline models.
+JSON only. No markdown.
+
+TOPIC: {query}
+
+=== EXISTING PAPER SUMMARIES ===
+{summaries}
+
+=== IDENTIFIED RESEARCH GAPS ===
+{gaps}""" % _OUTPUT_SCHEMA.replace("{", "{{").replace("}", "}}")
+
 
 class RoadmapAgent:
     """Generates a 30-day learning and research plan."""
@@ -42,71 +104,25 @@ class RoadmapAgent:
         Returns:
             Dict with weekly plans, project ideas, datasets, and baselines
         """
-        summaries_text = json.dumps(summaries, indent=2) if not isinstance(summaries, str) else summaries
-        gaps_text = json.dumps(gaps, indent=2) if not isinstance(gaps, str) else gaps
+        summaries_text = json.dumps(summaries) if not isinstance(summaries, str) else summaries
+        gaps_text = json.dumps(gaps) if not isinstance(gaps, str) else gaps
 
         messages = [
-            {
-                "role": "system",
-                "content": ROADMAP_ROLE
-            },
+            _SYSTEM_MESSAGE,
             {
                 "role": "user",
-                "content": f"""Create a 30-day researcher roadmap for this topic:
-
-TOPIC: {query}
-
-=== EXISTING PAPER SUMMARIES ===
-{summaries_text}
-
-=== IDENTIFIED RESEARCH GAPS ===
-{gaps_text}
-
-Return strictly valid JSON:
-{{
-    "roadmap": {{
-        "week_1": {{
-            "theme": "Foundations & Literature Review",
-            "tasks": ["<task 1>", "<task 2>", "<task 3>"],
-            "resources": ["<resource 1>", "<resource 2>"]
-        }},
-        "week_2": {{
-            "theme": "Technical Deep Dive",
-            "tasks": ["<task 1>", "<task 2>", "<task 3>"],
-            "resources": ["<resource 1>", "<resource 2>"]
-        }},
-        "week_3": {{
-            "theme": "Experimental Work",
-            "tasks": ["<task 1>", "<task 2>", "<task 3>"],
-            "resources": ["<resource 1>", "<resource 2>"]
-        }},
-        "week_4": {{
-            "theme": "Synthesis & Write-up",
-            "tasks": ["<task 1>", "<task 2>", "<task 3>"],
-            "resources": ["<resource 1>", "<resource 2>"]
-        }}
-    }},
-    "project_ideas": [
-        {{"title": "<project>", "difficulty": "beginner|intermediate|advanced", "description": "<brief>"}}
-    ],
-    "recommended_datasets": [
-        {{"name": "<dataset>", "description": "<what it contains>", "url": "<if known>"}}
-    ],
-    "baseline_models": [
-        {{"name": "<model>", "description": "<what it does>", "implementation": "<where to find>"}}
-    ],
-    "key_papers_to_read": ["<paper title 1>", "<paper title 2>", "<paper title 3>"]
-}}
-
-Provide at least 5 project ideas, 5 datasets, and 3 baseline models.
-JSON only. No markdown."""
+                "content": _USER_TEMPLATE.format(
+                    query=query,
+                    summaries=summaries_text,
+                    gaps=gaps_text
+                )
             }
         ]
 
-        response = await call_llm_async(messages, max_tokens=3000)
+        response = await call_llm_async(messages, max_tokens=3000, json_mode=True)
 
         try:
-            return json.loads(response)
+            return parse_llm_json(response)
         except json.JSONDecodeError as e:
             logger.error(f"Roadmap agent parse failed: {e}")
             return {
@@ -10,16 +10,47 @@ summaries, nothing downstream can function.
 WHAT IT EXTRACTS:
 For each paper: Title, Research Problem, Methodology, Dataset,
 Evaluation Metrics, Key Results, Limitations.
+
+CACHING:
+Summaries are cached per paper, keyed by a hash of (title, abstract).
+The same arXiv/PubMed papers reappear across overlapping queries, and a
+paper's abstract never changes — so already-seen papers cost nothing and
+only genuinely new papers go to the LLM.
 """
 
+import hashlib
 import json
 import logging
+from collections import OrderedDict
 from typing import List, Dict, Any
-from services.llm_service import call_llm_async
+from services.llm_service import call_llm_async, parse_llm_json
 from agents.system_prompt import SUMMARIZER_ROLE
 
 logger = logging.getLogger(__name__)
 
+# The system message never varies, so build the dict once instead of
+# per call.
+_SYSTEM_MESSAGE = {"role": "system", "content": SUMMARIZER_ROLE}
+
+# Output budget per paper in the batched call. A fixed total starved
+# large batches (2000 tokens across 10 papers is ~200 each — summaries
+# got truncated mid-field), while scaling with the batch keeps roughly
+# the same per-paper room regardless of how many papers came back.
+_TOKENS_PER_PAPER = 350
+_MAX_BATCH_TOKENS = 4000
+
+# Per-paper summary cache (LRU, process-local). No TTL: a summary of a
+# fixed title+abstract doesn't go stale the way a free-form LLM answer
+# might.
+_CACHE_MAX_ENTRIES = 512
+_summary_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def _paper_key(paper: Any) -> str:
+    """Stable content hash for a paper's (title, abstract)."""
+    payload = f"{paper.title}\x1f{paper.abstract}"
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
 
 class SummarizerAgent:
     """Agent for summarizing academic research papers."""
@@ -37,19 +68,63 @@ class SummarizerAgent:
         if not papers:
             raise ValueError("papers list cannot be empty")
 
-        paper_text = ""
-
-        for paper in papers:
-            paper_text += f"""
-            Title: {paper.title}
-            Abstract: {paper.abstract}
-            """
+        # Partition into cache hits and papers that still need the LLM
+        keys = [_paper_key(p) for p in papers]
+        cached: Dict[str, Dict[str, Any]] = {}
+        uncached = []
+        for paper, key in zip(papers, keys):
+            if key in _summary_cache:
+                _summary_cache.move_to_end(key)
+                cached[key] = _summary_cache[key]
+            else:
+                uncached.append((paper, key))
+
+        if cached:
+            logger.info(
+                f"Summary cache: {len(cached)}/{len(papers)} papers already summarized"
+            )
+
+        if not uncached:
+            return [cached[key] for key in keys]
+
+        fresh = await self._summarize_batch([paper for paper, _ in uncached])
+
+        # Only cache when the LLM returned exactly one summary per paper —
+        # otherwise we can't trust the pairing.
+        if isinstance(fresh, list) and len(fresh) == len(uncached):
+            for (_, key), summary in zip(uncached, fresh):
+                _summary_cache[key] = summary
+                _summary_cache.move_to_end(key)
+            while len(_summary_cache) > _CACHE_MAX_ENTRIES:
+                _summary_cache.popitem(last=False)
+        elif cached:
+            logger.warning(
+                "Summarizer returned unexpected shape for uncached papers — "
+                "skipping cache merge for this batch"
+            )
+            return fresh
+        else:
+            return fresh
+
+        # Merge cached + fresh back into the original paper order.
+        # Membership, not truthiness: a degraded-but-cached summary can
+        # be falsy (null/{} entries pass the length check above), and it
+        # must still come from the cache — its key isn't in fresh_by_key.
+        fresh_by_key = {key: summary for (_, key), summary in zip(uncached, fresh)}
+        return [cached[key] if key in cached else fresh_by_key[key] for key in keys]
+
+    async def _summarize_batch(self, papers: List[Any]) -> Any:
+        """Summarize a batch of papers with a single LLM call."""
+        # Single join instead of += in a loop, without the 12-space
+        # indentation the old f-string carried — that whitespace was
+        # tokenized and billed on every call
+        paper_text = "\n\n".join(
+            f"Title: {paper.title}\nAbstract: {paper.abstract}"
+            for paper in papers
+        )
 
         messages = [
-            {
-                "role": "system",
-                "content": SUMMARIZER_ROLE
-            },
+            _SYSTEM_MESSAGE,
             {
                 "role": "user",
                 "content": f"""
@@ -73,11 +148,12 @@ class SummarizerAgent:
             }
         ]
 
-        response = await call_llm_async(messages, max_tokens=2000)
+        max_tokens = min(_MAX_BATCH_TOKENS, _TOKENS_PER_PAPER * len(papers))
+        response = await call_llm_async(messages, max_tokens=max_tokens)
 
         try:
-            parsed = json.loads(response)
+            parsed = parse_llm_json(response)
             return parsed
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse LLM response: {str(e)}")
-            return {"error": "Invalid JSON from LLM", "raw_output": response}
\ No newline at end of file
+            return {"error": "Invalid JSON from LLM", "raw_output": response}
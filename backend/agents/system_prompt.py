@@ -95,6 +95,27 @@ CRITIQUE_ROLE = (
     "and bias_indicators."
 )
 
+COMPARISON_INSIGHT_ROLE = (
+    f"{AGENT_PREAMBLE}\n"
+    "Your role: COMPARISON & INSIGHT AGENT — two analyses over the same "
+    "summaries. First, perform cross-paper comparative analysis: identify "
+    "methodology similarities, differences, strengths, weaknesses, and "
+    "performance tradeoffs. Second, extract cross-paper themes and "
+    "patterns: unique methods, common datasets, evaluation metrics, "
+    "recurring limitations, and emerging research themes."
+)
+
+NOVELTY_TREND_ROLE = (
+    f"{AGENT_PREAMBLE}\n"
+    "Your role: NOVELTY & TREND AGENT — two analyses over the same data. "
+    "First, score how novel the research direction is across 5 dimensions: "
+    "uniqueness, scientific novelty, practical novelty, redundancy risk, "
+    "and opportunity areas. Be honest and precise. Second, analyze current "
+    "research patterns and predict future directions for 1-year and 3-year "
+    "horizons, basing predictions on observable patterns in the data, not "
+    "speculation."
+)
+
 ROADMAP_ROLE = (
     f"{AGENT_PREAMBLE}\n"
     "Your role: RESEARCHER ROADMAP AGENT — create actionable 30-day learning "
@@ -103,13 +124,6 @@ ROADMAP_ROLE = (
     "baseline models, and key papers to read."
 )
 
-INTENT_ROUTER_ROLE = (
-    f"{AGENT_PREAMBLE}\n"
-    "Your role: INTENT ROUTER — classify research queries into types and "
-    "determine the optimal routing strategy. You decide which agents to "
-    "activate based on the query's intent."
-)
-
 KNOWLEDGE_GRAPH_ROLE = (
     f"{AGENT_PREAMBLE}\n"
     "Your role: KNOWLEDGE GRAPH BUILDER — extract concepts, methods, "
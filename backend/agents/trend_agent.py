@@ -15,7 +15,7 @@ not just today. It also helps identify when a field is getting saturated.
 import json
 import logging
 from typing import Dict, Any
-from services.llm_service import call_llm_async
+from services.llm_service import call_llm_async, parse_llm_json
 from agents.system_prompt import TREND_ROLE
 
 logger = logging.getLogger(__name__)
@@ -41,8 +41,8 @@ class TrendAgent:
         Returns:
             Dict with trend analysis, predictions, and emerging tools
         """
-        summaries_text = json.dumps(summaries, indent=2) if not isinstance(summaries, str) else summaries
-        insights_text = json.dumps(insights, indent=2) if not isinstance(insights, str) else insights
+        summaries_text = json.dumps(summaries) if not isinstance(summaries, str) else summaries
+        insights_text = json.dumps(insights) if not isinstance(insights, str) else insights
 
         messages = [
             {
@@ -90,10 +90,10 @@ JSON only. No markdown."""
             }
         ]
 
-        response = await call_llm_async(messages, max_tokens=2000)
+        response = await call_llm_async(messages, max_tokens=2000, json_mode=True)
 
         try:
-            return json.loads(response)
+            return parse_llm_json(response)
         except json.JSONDecodeError as e:
             logger.error(f"Trend agent parse failed: {e}")
             return {
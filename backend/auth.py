@@ -1,19 +1,17 @@
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
 import bcrypt
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from database import get_db
 from models import User
-import os
-from dotenv import load_dotenv
+from config import settings
 
-load_dotenv()
-
-SECRET_KEY = os.getenv("SECRET_KEY")
-ALGORITHM = os.getenv("ALGORITHM")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
+SECRET_KEY = settings.SECRET_KEY
+ALGORITHM = settings.ALGORITHM
+ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 
 # This tells FastAPI how to extract token
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
@@ -37,9 +35,9 @@ def create_access_token(data: dict):
 
 
 # ---------------- CURRENT USER ----------------
-def get_current_user(
+async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -51,7 +49,8 @@ def get_current_user(
                 detail="Invalid token"
             )
 
-        user = db.query(User).filter(User.email == user_email).first()
+        result = await db.execute(select(User).where(User.email == user_email))
+        user = result.scalar_one_or_none()
 
         if user is None:
             raise HTTPException(
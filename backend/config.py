@@ -29,9 +29,38 @@ class Settings(BaseSettings):
     # --- LLM (Groq) ---
     GROQ_API_KEY: str
     LLM_MODEL: str = "llama-3.3-70b-versatile"
+    # Distilled tier for extraction-style agents that don't need the
+    # large model's reasoning depth — markedly faster and cheaper.
+    LLM_MODEL_FAST: str = "llama-3.1-8b-instant"
     LLM_TEMPERATURE: float = 0.3
     LLM_MAX_TOKENS: int = 2000
 
+    # --- LLM Throttling ---
+    # Concurrency cap + request rate for Groq calls. Keeps parallel agent
+    # waves (and concurrent API requests) from tripping provider 429s,
+    # which cost far more in backoff sleeps than the throttle does.
+    LLM_MAX_CONCURRENCY: int = 8
+    LLM_REQUESTS_PER_MINUTE: int = 30
+
+    # --- LLM Response Cache ---
+    LLM_CACHE_TTL_SECONDS: int = 3600
+    LLM_CACHE_MAX_ENTRIES: int = 256
+
+    # --- Resilience ---
+    # Per-agent wall-clock bound: a hung LLM call degrades that one
+    # agent instead of stalling the whole pipeline. Circuit breaker:
+    # after this many consecutive LLM failures, fail fast for the
+    # cooldown window instead of hammering a degraded provider.
+    AGENT_TIMEOUT_SECONDS: float = 90.0
+    LLM_BREAKER_FAILURE_THRESHOLD: int = 5
+    LLM_BREAKER_COOLDOWN_SECONDS: float = 60.0
+
+    # --- Prompt Budget ---
+    # Max characters of serialized summaries embedded per prompt
+    # (~6k tokens). Keeps worst-case prompts inside the model's context
+    # and stops token cost growing unbounded with paper count.
+    PROMPT_CHAR_BUDGET: int = 24000
+
     # --- Paper Search ---
     ARXIV_MAX_RESULTS: int = 5
     PUBMED_MAX_RESULTS: int = 5
@@ -1,35 +1,51 @@
-import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
-from dotenv import load_dotenv
-
-load_dotenv()
-
-DATABASE_URL = os.getenv("DATABASE_URL")
-
-# SQLite needs check_same_thread=False for FastAPI's threaded requests
-connect_args = {"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-engine = create_engine(DATABASE_URL, connect_args=connect_args)
-
-SessionLocal = sessionmaker(
-    autocommit=False,
+"""
+Async database setup.
+
+WHY ASYNC:
+The sync engine's sessions blocked the event loop on every query, so DB
+round-trips stalled concurrent LLM calls and other requests. With
+create_async_engine + async_sessionmaker every query awaits on the loop
+— DB I/O overlaps with everything else, which is what makes the async
+LLM client and the agent DAG actually pay off under load.
+
+The configured DATABASE_URL keeps its familiar sync form; the async
+driver (aiosqlite / asyncpg) is spliced in here so .env files don't
+need to change.
+"""
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+
+from config import settings
+
+DATABASE_URL = settings.DATABASE_URL
+if DATABASE_URL.startswith("sqlite://"):
+    DATABASE_URL = DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
+elif DATABASE_URL.startswith("postgresql://"):
+    DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+engine = create_async_engine(DATABASE_URL)
+
+# expire_on_commit=False: committed objects stay usable after the
+# session commits — handlers return them in the response, and a lazy
+# refresh after commit would be an extra await per request.
+AsyncSessionLocal = async_sessionmaker(
+    engine,
+    expire_on_commit=False,
     autoflush=False,
-    bind=engine
 )
 
 Base = declarative_base()
 
 
 # Dependency for FastAPI
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def init_db():
+async def init_db():
     """Create all tables. Called once at startup."""
     from models import User, Workspace, Conversation, Paper, AnalysisResult  # noqa
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
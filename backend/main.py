@@ -3,27 +3,43 @@ ResearchHub AI Backend — v4.0
 Multi-agent scientific reasoning system.
 
 This is the FastAPI entry point. All it does:
-1. Load environment variables
-2. Configure logging
-3. Set up CORS (so frontend can talk to backend)
-4. Include all 4 routers (auth, workspace, paper, chat)
+1. Configure logging
+2. Set up CORS (so frontend can talk to backend)
+3. Include all 4 routers (auth, workspace, paper, chat)
+
+Environment loading happens exactly once, in config.py — every module
+reads from config.settings instead of re-parsing .env itself.
 """
 
 import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from dotenv import load_dotenv
 
 from routers import auth_router
 from routers import workspace_router
 from routers import paper_router
 from routers import chat_router
 
-load_dotenv()
+# Use uvloop's libuv-based event loop when available. The whole agent
+# pipeline is async network I/O, so a faster loop speeds up every
+# gather-ed wave for free. Optional — the stdlib loop works fine too.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
-# Auto-create all tables on startup (safe to call repeatedly)
-from database import init_db
-init_db()
+# Serialize responses with orjson when available. The /chat endpoints
+# return multi-kilobyte nested analysis JSON, and orjson encodes those
+# several times faster than the stdlib encoder the default JSONResponse
+# uses. Optional, like everywhere else orjson appears in this codebase.
+# Probe orjson itself — FastAPI always defines ORJSONResponse and only
+# fails (per response, inside render()) when orjson is missing.
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as _DefaultResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as _DefaultResponse
 
 # Configure logging so all agents/services log properly
 logging.basicConfig(
@@ -34,7 +50,8 @@ logging.basicConfig(
 app = FastAPI(
     title="ResearchHub AI",
     description="Multi-agent scientific reasoning system with 16-section analysis pipeline",
-    version="4.0"
+    version="4.0",
+    default_response_class=_DefaultResponse
 )
 
 # CORS middleware — explicit origins required when credentials=True
@@ -46,6 +63,43 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def _init_db():
+    """Auto-create all tables (safe to call repeatedly). Runs on the
+    async engine, so it lives in a startup hook rather than at import."""
+    from database import init_db
+    await init_db()
+
+
+@app.on_event("startup")
+async def _enable_eager_tasks():
+    """
+    Run gathered coroutines eagerly (Python 3.12+).
+
+    The orchestrator fans agents out with asyncio.gather/wait, and many
+    of those coroutines short-circuit (cache hits, validation errors,
+    fallbacks). With the eager task factory their first step runs
+    synchronously instead of paying a full event-loop round-trip each.
+    """
+    import asyncio
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+
+@app.on_event("shutdown")
+async def _close_llm_client():
+    """Tear down the shared Groq connection pool cleanly."""
+    from services.llm_service import aclose_client
+    await aclose_client()
+
+
+@app.on_event("shutdown")
+async def _close_search_client():
+    """Tear down the shared paper-search connection pool cleanly."""
+    from services.paper_search import aclose_http_client
+    await aclose_http_client()
+
+
 # Include all routers
 app.include_router(auth_router.router)
 app.include_router(workspace_router.router)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
@@ -59,6 +59,13 @@ class AnalysisResult(Base):
     """
     __tablename__ = "analysis_results"
 
+    # The history endpoint always filters by workspace and orders by
+    # recency — this composite index serves that query directly instead
+    # of a scan-and-sort over every stored analysis.
+    __table_args__ = (
+        Index("ix_analysis_ws_created", "workspace_id", "created_at"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     workspace_id = Column(Integer, ForeignKey("workspaces.id"))
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -18,7 +18,8 @@ import time
 import json
 import logging
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_db
 from models import User, AnalysisResult, Workspace
@@ -30,11 +31,20 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/chat", tags=["Chat & Analysis"])
 
+# One orchestrator for the process, like the module-level agent
+# singletons inside it. It holds no per-request state, so constructing
+# a fresh instance on every /chat/analyze is pure allocation overhead.
+_orchestrator = AgentOrchestrator()
 
-@router.post("/analyze", response_model=ChatResponse)
+
+# No response_model on purpose: declaring one makes FastAPI re-validate
+# and re-serialize the full 16-section payload through pydantic on every
+# response, which is exactly what the model_construct below avoids. The
+# responses mapping keeps the schema in the OpenAPI docs.
+@router.post("/analyze", responses={200: {"model": ChatResponse}})
 async def analyze(
     request: ChatRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -53,10 +63,13 @@ async def analyze(
 
     # Validate workspace ownership if workspace_id provided
     if request.workspace_id:
-        workspace = db.query(Workspace).filter(
-            Workspace.id == request.workspace_id,
-            Workspace.owner_id == current_user.id
-        ).first()
+        result = await db.execute(
+            select(Workspace).where(
+                Workspace.id == request.workspace_id,
+                Workspace.owner_id == current_user.id
+            )
+        )
+        workspace = result.scalar_one_or_none()
 
         if not workspace:
             raise HTTPException(status_code=404, detail="Workspace not found")
@@ -65,8 +78,7 @@ async def analyze(
     start_time = time.time()
 
     try:
-        orchestrator = AgentOrchestrator()
-        result = await orchestrator.run(request.query)
+        result = await _orchestrator.run(request.query)
     except Exception as e:
         logger.error(f"Pipeline failed for query '{request.query}': {e}")
         raise HTTPException(
@@ -86,12 +98,17 @@ async def analyze(
                 result_json=result
             )
             db.add(analysis)
-            db.commit()
+            await db.commit()
         except Exception as e:
             logger.error(f"Failed to save analysis result: {e}")
             # Don't fail the request if DB save fails — still return the result
 
-    return ChatResponse(
+    # model_construct skips pydantic validation: every field here is
+    # produced by our own code (the orchestrator's result dict, possibly
+    # straight from its query cache), so re-validating the full
+    # 16-section payload on each response — including cache hits — buys
+    # nothing.
+    return ChatResponse.model_construct(
         query=request.query,
         result=result,
         pipeline_time_seconds=pipeline_time
@@ -99,49 +116,65 @@ async def analyze(
 
 
 @router.get("/history/{workspace_id}")
-def get_analysis_history(
+async def get_analysis_history(
     workspace_id: int,
-    db: Session = Depends(get_db),
+    limit: int = 50,
+    offset: int = 0,
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get past analysis results for a workspace.
-    Returns list of past queries with timestamps (without full results for speed).
+    Get past analysis results for a workspace, newest first.
+
+    Paginated (limit/offset) and column-pruned: selecting only
+    id/query/created_at keeps the multi-kilobyte result_json blobs out
+    of the query entirely — the listing never needs them, and fetching
+    them for every row is what made unbounded history slow.
     """
     # Verify workspace ownership
-    workspace = db.query(Workspace).filter(
-        Workspace.id == workspace_id,
-        Workspace.owner_id == current_user.id
-    ).first()
+    result = await db.execute(
+        select(Workspace).where(
+            Workspace.id == workspace_id,
+            Workspace.owner_id == current_user.id
+        )
+    )
+    workspace = result.scalar_one_or_none()
 
     if not workspace:
         raise HTTPException(status_code=404, detail="Workspace not found")
 
-    analyses = db.query(AnalysisResult).filter(
-        AnalysisResult.workspace_id == workspace_id
-    ).order_by(AnalysisResult.created_at.desc()).all()
+    result = await db.execute(
+        select(AnalysisResult.id, AnalysisResult.query, AnalysisResult.created_at)
+        .where(AnalysisResult.workspace_id == workspace_id)
+        .order_by(AnalysisResult.created_at.desc())
+        .limit(limit)
+        .offset(offset)
+    )
 
     return [
         {
-            "id": a.id,
-            "query": a.query,
-            "created_at": a.created_at.isoformat() if a.created_at else None
+            "id": row.id,
+            "query": row.query,
+            "created_at": row.created_at.isoformat() if row.created_at else None
         }
-        for a in analyses
+        for row in result.all()
     ]
 
 
 @router.get("/result/{analysis_id}")
-def get_analysis_result(
+async def get_analysis_result(
     analysis_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get the full result of a past analysis by its ID."""
-    analysis = db.query(AnalysisResult).filter(
-        AnalysisResult.id == analysis_id,
-        AnalysisResult.user_id == current_user.id
-    ).first()
+    result = await db.execute(
+        select(AnalysisResult).where(
+            AnalysisResult.id == analysis_id,
+            AnalysisResult.user_id == current_user.id
+        )
+    )
+    analysis = result.scalar_one_or_none()
 
     if not analysis:
         raise HTTPException(status_code=404, detail="Analysis not found")
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from database import get_db
@@ -10,55 +11,66 @@ from schemas import PaperResponse
 router = APIRouter(prefix="/papers", tags=["Papers"])
 
 
-# ---------------- UPLOAD PAPER ----------------
-@router.post("/{workspace_id}", response_model=PaperResponse)
-def upload_paper(
+# ---------------- UPLOAD PAPERS ----------------
+@router.post("/{workspace_id}", response_model=List[PaperResponse])
+async def upload_papers(
     workspace_id: int,
-    file: UploadFile = File(...),
-    db: Session = Depends(get_db),
+    files: List[UploadFile] = File(...),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
+    """
+    Upload one or more papers in a single request.
 
+    Accepting a list means a multi-file drop costs one request — one
+    auth check, one ownership query, one commit — instead of repeating
+    all three per file.
+    """
     # Verify workspace ownership
-    workspace = db.query(Workspace).filter(
-        Workspace.id == workspace_id,
-        Workspace.owner_id == current_user.id
-    ).first()
+    result = await db.execute(
+        select(Workspace).where(
+            Workspace.id == workspace_id,
+            Workspace.owner_id == current_user.id
+        )
+    )
+    workspace = result.scalar_one_or_none()
 
     if not workspace:
         raise HTTPException(status_code=404, detail="Workspace not found")
 
     # Save metadata to DB
-    new_paper = Paper(
-        filename=file.filename,
-        workspace_id=workspace_id
-    )
+    new_papers = [
+        Paper(filename=file.filename, workspace_id=workspace_id)
+        for file in files
+    ]
 
-    db.add(new_paper)
-    db.commit()
-    db.refresh(new_paper)
+    db.add_all(new_papers)
+    await db.commit()
 
-    return new_paper
+    return new_papers
 
 
 # ---------------- LIST PAPERS IN WORKSPACE ----------------
 @router.get("/{workspace_id}", response_model=List[PaperResponse])
-def list_papers(
+async def list_papers(
     workspace_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
 
-    workspace = db.query(Workspace).filter(
-        Workspace.id == workspace_id,
-        Workspace.owner_id == current_user.id
-    ).first()
+    result = await db.execute(
+        select(Workspace).where(
+            Workspace.id == workspace_id,
+            Workspace.owner_id == current_user.id
+        )
+    )
+    workspace = result.scalar_one_or_none()
 
     if not workspace:
         raise HTTPException(status_code=404, detail="Workspace not found")
 
-    papers = db.query(Paper).filter(
-        Paper.workspace_id == workspace_id
-    ).all()
+    papers = await db.execute(
+        select(Paper).where(Paper.workspace_id == workspace_id)
+    )
 
-    return papers
\ No newline at end of file
+    return papers.scalars().all()
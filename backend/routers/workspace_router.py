@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from database import get_db
@@ -12,9 +13,9 @@ router = APIRouter(prefix="/workspaces", tags=["Workspaces"])
 
 # ---------------- CREATE WORKSPACE ----------------
 @router.post("/", response_model=WorkspaceResponse)
-def create_workspace(
+async def create_workspace(
     request: WorkspaceCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
 
@@ -24,43 +25,45 @@ def create_workspace(
     )
 
     db.add(new_workspace)
-    db.commit()
-    db.refresh(new_workspace)
+    await db.commit()
 
     return new_workspace
 
 
 # ---------------- LIST USER WORKSPACES ----------------
 @router.get("/", response_model=List[WorkspaceResponse])
-def list_workspaces(
-    db: Session = Depends(get_db),
+async def list_workspaces(
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
 
-    workspaces = db.query(Workspace).filter(
-        Workspace.owner_id == current_user.id
-    ).all()
+    result = await db.execute(
+        select(Workspace).where(Workspace.owner_id == current_user.id)
+    )
 
-    return workspaces
+    return result.scalars().all()
 
 
 # ---------------- DELETE WORKSPACE ----------------
 @router.delete("/{workspace_id}")
-def delete_workspace(
+async def delete_workspace(
     workspace_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
 
-    workspace = db.query(Workspace).filter(
-        Workspace.id == workspace_id,
-        Workspace.owner_id == current_user.id
-    ).first()
+    result = await db.execute(
+        select(Workspace).where(
+            Workspace.id == workspace_id,
+            Workspace.owner_id == current_user.id
+        )
+    )
+    workspace = result.scalar_one_or_none()
 
     if not workspace:
         raise HTTPException(status_code=404, detail="Workspace not found")
 
-    db.delete(workspace)
-    db.commit()
+    await db.delete(workspace)
+    await db.commit()
 
-    return {"message": "Workspace deleted successfully"}
\ No newline at end of file
+    return {"message": "Workspace deleted successfully"}
@@ -2,41 +2,275 @@
 Async LLM Service with retry logic for ResearchHub AI.
 
 WHY THIS REPLACES groq_client.py:
-1. ASYNC: groq_client.py blocks the event loop. This uses asyncio.to_thread()
-   so FastAPI can handle other requests while waiting for Groq.
-2. RETRY: If Groq rate-limits or has a blip, we retry 3x with exponential backoff
-   (1s → 2s → 4s) instead of crashing immediately.
+1. ASYNC: groq_client.py blocks the event loop. This uses the SDK's
+   native AsyncGroq client, so calls await on the event loop directly —
+   no worker thread per call, and FastAPI keeps handling other requests
+   while waiting for Groq.
+2. RETRY: If Groq rate-limits or has a blip, we retry 3x with jittered
+   exponential backoff (respecting Retry-After when the provider sends
+   one) instead of crashing immediately.
 3. FLEXIBLE: Each agent can request different max_tokens — the literature agent
    needs 4000 tokens but the novelty agent only needs 1500.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
-from groq import Groq
+import random
+import time
+from collections import OrderedDict
+import httpx
+from groq import AsyncGroq
 from config import settings
 
+# orjson parses 2-5x faster than stdlib json and its JSONDecodeError
+# subclasses json.JSONDecodeError, so callers' except clauses are
+# unaffected. Fall back to stdlib if it isn't installed.
+try:
+    import orjson as _json_parser
+except ImportError:
+    _json_parser = json
+
 logger = logging.getLogger(__name__)
 
-# Initialize Groq client once (reused across all calls)
-_client = Groq(api_key=settings.GROQ_API_KEY)
+# Groq client is built lazily on first call (not at import) so cold
+# start stays cheap and importing this module never requires a valid
+# API key — tooling and scripts can import agents without credentials.
+# Once built, it is reused across all calls with an explicit shared
+# connection pool. The SDK's default httpx client caps keep-alive
+# connections low, so the orchestrator's parallel agent waves (up to 7
+# concurrent calls) would queue on connection setup and re-pay TLS
+# handshakes. Sizing the pool above the widest wave keeps every call on
+# a warm connection.
+_client = None
+
+
+def _get_client() -> AsyncGroq:
+    """Return the shared AsyncGroq client, constructing it on first use."""
+    global _client
+    if _client is None:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            timeout=httpx.Timeout(120.0, connect=10.0),
+        )
+        _client = AsyncGroq(api_key=settings.GROQ_API_KEY, http_client=_http_client)
+    return _client
+
+
+async def aclose_client():
+    """
+    Close the shared client's connection pool.
+
+    Called from the FastAPI shutdown hook so keep-alive connections are
+    torn down cleanly instead of left to the GC.
+    """
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
+
+# ── Response cache ───────────────────────────────────────────────────
+# Exact-match cache in front of the Groq API. Agents rebuild identical
+# prompts for identical inputs (re-runs, dev iterations, retried
+# pipelines), and a cache hit eliminates the entire LLM round-trip and
+# its token cost. Keyed by a blake2b digest of the messages + max_tokens,
+# evicted LRU-style with a TTL so stale answers age out.
+_response_cache: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+
+
+def _cache_key(messages: list, max_tokens: int, json_mode: bool = False, model: str = None) -> str:
+    """Stable content hash for a (model, messages, temperature, max_tokens, json_mode) request.
+
+    Temperature is part of the key so a cached answer is only reused for
+    the exact sampling configuration that produced it — if the configured
+    temperature changes, old entries silently miss instead of serving
+    responses generated under different settings.
+    """
+    payload = (
+        json.dumps(messages, sort_keys=True)
+        + str(max_tokens) + str(json_mode) + (model or settings.LLM_MODEL)
+        + str(settings.LLM_TEMPERATURE)
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _cache_get(key: str) -> str:
+    """Return cached response or None if missing/expired."""
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+
+    stored_at, response = entry
+    if time.time() - stored_at > settings.LLM_CACHE_TTL_SECONDS:
+        del _response_cache[key]
+        return None
+
+    _response_cache.move_to_end(key)  # LRU: mark as recently used
+    return response
+
+
+def _cache_put(key: str, response: str):
+    """Store a response, evicting the least-recently-used entry if full."""
+    _response_cache[key] = (time.time(), response)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > settings.LLM_CACHE_MAX_ENTRIES:
+        _response_cache.popitem(last=False)
+
 
+# ── Throttling ───────────────────────────────────────────────────────
+# Two layers in front of every API call:
+# 1. Semaphore — caps in-flight calls so stacked parallel waves (several
+#    concurrent /chat/analyze requests) can't open unbounded connections.
+# 2. Token bucket — smooths the request rate under Groq's per-minute
+#    limit. Waiting a fraction of a second here is far cheaper than
+#    tripping a 429 and sleeping through exponential backoff.
+_semaphore = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+
+
+class _TokenBucket:
+    """Minimal async token bucket: capacity == refill rate per minute."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.fill_rate = per_minute / 60.0  # tokens per second
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Block until a request token is available."""
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated) * self.fill_rate
+                )
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait_time = (1.0 - self.tokens) / self.fill_rate
+            await asyncio.sleep(wait_time)
+
+
+_rate_limiter = _TokenBucket(settings.LLM_REQUESTS_PER_MINUTE)
+
+
+# ── Circuit breaker ──────────────────────────────────────────────────
+# When the provider is down, every call burns its full retry/backoff
+# budget before failing — parallel agent waves amplify that into minutes
+# of doomed sleeping. After enough consecutive failures the breaker
+# opens and calls fail fast for a cooldown window; the first success
+# after cooldown closes it again.
+class _CircuitBreaker:
+    """Consecutive-failure circuit breaker with a cooldown window."""
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def check(self):
+        """Raise RuntimeError if the breaker is open (fail fast)."""
+        if self.failures >= self.threshold:
+            remaining = self.cooldown - (time.monotonic() - self.opened_at)
+            if remaining > 0:
+                raise RuntimeError(
+                    f"LLM circuit breaker open after {self.failures} consecutive "
+                    f"failures — retrying in {remaining:.0f}s"
+                )
+            # Cooldown elapsed: half-open, let the next call probe
+            self.failures = self.threshold - 1
+
+    def record_success(self):
+        self.failures = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+            logger.error(
+                f"LLM circuit breaker opened after {self.failures} consecutive failures"
+            )
+
+
+_breaker = _CircuitBreaker(
+    settings.LLM_BREAKER_FAILURE_THRESHOLD,
+    settings.LLM_BREAKER_COOLDOWN_SECONDS,
+)
+
+
+async def _api_call(
+    messages: list,
+    max_tokens: int = None,
+    stream: bool = False,
+    json_mode: bool = False,
+    model: str = None
+) -> str:
+    """Single Groq API call on the shared async client."""
+    # JSON mode and streaming are mutually exclusive on Groq's API;
+    # JSON mode wins because a malformed document is useless to agents.
+    if json_mode:
+        stream = False
 
-def _sync_call(messages: list, max_tokens: int = None) -> str:
-    """Synchronous Groq API call (runs inside thread pool)."""
-    response = _client.chat.completions.create(
+    response = await _get_client().chat.completions.create(
         messages=messages,
-        model=settings.LLM_MODEL,
+        model=model or settings.LLM_MODEL,
         temperature=settings.LLM_TEMPERATURE,
         max_tokens=max_tokens or settings.LLM_MAX_TOKENS,
+        stream=stream,
+        response_format={"type": "json_object"} if json_mode else None,
     )
-    return response.choices[0].message.content
+
+    if not stream:
+        return response.choices[0].message.content
+
+    # Streaming: consume tokens as they are generated instead of buffering
+    # the whole completion server-side. Long generations start flowing
+    # immediately, transport errors surface at the failing token rather
+    # than after a full-response timeout, and peak memory is one chunk.
+    parts = []
+    async for chunk in response:
+        delta = chunk.choices[0].delta.content
+        if delta:
+            parts.append(delta)
+    return "".join(parts)
+
+
+def _retry_wait(error: Exception, attempt: int, backoff_base: float) -> float:
+    """
+    How long to sleep before retry `attempt`.
+
+    Honors the provider's Retry-After header when the failure carries
+    one (Groq 429s do — the SDK exposes the httpx response on the
+    exception), since the server knows exactly when capacity returns.
+    Otherwise full-jitter backoff: a uniform draw from [0, base * 2^n]
+    instead of the deterministic base * 2^n, so a burst of coroutines
+    that failed together doesn't retry in lockstep and re-collide on
+    the same rate-limit window.
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is not None:
+        retry_after = headers.get("retry-after")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass  # HTTP-date form — fall through to jittered backoff
+    return random.uniform(0, backoff_base * (2 ** attempt))
 
 
 async def call_llm_async(
     messages: list,
     max_tokens: int = None,
     retries: int = 3,
-    backoff_base: float = 1.0
+    backoff_base: float = 1.0,
+    stream: bool = False,
+    json_mode: bool = False,
+    model: str = None
 ) -> str:
     """
     Async LLM call with exponential backoff retry.
@@ -45,31 +279,68 @@ async def call_llm_async(
         messages: Chat messages list (system + user)
         max_tokens: Override default max tokens for this call
         retries: Number of retry attempts (default 3)
-        backoff_base: Base delay in seconds (doubles each retry)
+        backoff_base: Backoff cap base in seconds (the cap doubles each
+            retry; actual sleep is jittered — see _retry_wait)
+        stream: Consume the completion incrementally over SSE instead of
+            waiting for the provider to buffer the full response
+        json_mode: Constrain decoding to valid JSON via the provider's
+            response_format. Eliminates markdown fences and truncated
+            documents, so the parse-retry path never fires
+        model: Override the default model (e.g. settings.LLM_MODEL_FAST
+            for agents that don't need the large model's reasoning)
 
     Returns:
         LLM response text
 
     Raises:
-        RuntimeError: If all retries are exhausted
+        RuntimeError: If all retries are exhausted. Non-retryable
+            provider errors (4xx other than 429) propagate immediately
+            without consuming the retry budget.
     """
     if not messages:
         raise ValueError("messages cannot be empty")
 
+    # Cache check — a hit skips the network entirely
+    cache_key = _cache_key(messages, max_tokens, json_mode, model)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        logger.debug("LLM cache hit — skipping API call")
+        return cached
+
     last_error = None
 
+    # Fail fast while the provider is known-degraded
+    _breaker.check()
+
     for attempt in range(retries):
         try:
-            # Run sync Groq call in thread pool (non-blocking)
-            result = await asyncio.to_thread(_sync_call, messages, max_tokens)
+            async with _semaphore:
+                await _rate_limiter.acquire()
+                result = await _api_call(messages, max_tokens, stream, json_mode, model)
+            _breaker.record_success()
+            _cache_put(cache_key, result)
             return result
 
         except Exception as e:
+            _breaker.record_failure()
             last_error = e
-            wait_time = backoff_base * (2 ** attempt)
+
+            # A 4xx other than 429 means the request itself is bad —
+            # auth failure, malformed payload, prompt too large.
+            # Retrying re-sends the same bytes to the same verdict, so
+            # surface it immediately instead of walking the backoff
+            # budget. The SDK puts the code on the exception itself;
+            # plain httpx errors carry it on the attached response.
+            status = getattr(e, "status_code", None)
+            if status is None:
+                status = getattr(getattr(e, "response", None), "status_code", None)
+            if status is not None and 400 <= status < 500 and status != 429:
+                raise
+
+            wait_time = _retry_wait(e, attempt, backoff_base)
             logger.warning(
                 f"LLM call failed (attempt {attempt + 1}/{retries}): {e}. "
-                f"Retrying in {wait_time}s..."
+                f"Retrying in {wait_time:.1f}s..."
             )
 
             if attempt < retries - 1:
@@ -78,3 +349,89 @@ async def call_llm_async(
     raise RuntimeError(
         f"LLM call failed after {retries} attempts. Last error: {last_error}"
     )
+
+
+_decoder = json.JSONDecoder()
+
+
+def _salvage_json(response: str):
+    """
+    Last-chance parse for LLM output with text around the document.
+
+    Calls that can't use json_mode (the summarizer returns a top-level
+    array) occasionally wrap their JSON in prose or markdown fences.
+    Discarding those responses wastes the entire LLM call — the caller's
+    fallback path either degrades the section or pays for a retry.
+    raw_decode from the first brace/bracket recovers the embedded
+    document and ignores trailing text. Raises json.JSONDecodeError
+    when nothing can be recovered, preserving the caller contract.
+    """
+    starts = [i for i in (response.find("{"), response.find("[")) if i != -1]
+    if not starts:
+        raise json.JSONDecodeError("No JSON document in LLM response", response, 0)
+    parsed, _ = _decoder.raw_decode(response, min(starts))
+    return parsed
+
+
+def parse_llm_json(response):
+    """
+    Parse a JSON document returned by the LLM.
+
+    Every JSON-returning agent funnels through here, so the fast parser
+    (orjson when available) benefits the whole pipeline. Already-parsed
+    structures pass through untouched — re-parsing a dict would throw
+    and needlessly trip the caller's fallback path. Responses that fail
+    a strict parse get one salvage attempt (see _salvage_json) before
+    json.JSONDecodeError propagates exactly like json.loads.
+    """
+    if isinstance(response, (dict, list)):
+        return response
+    try:
+        return _json_parser.loads(response)
+    except json.JSONDecodeError:
+        return _salvage_json(response)
+
+
+def dumps_compact(obj) -> str:
+    """
+    Serialize to compact JSON for embedding in prompts.
+
+    Counterpart to parse_llm_json: orjson when available (its output is
+    compact by default and ~5x faster than stdlib), otherwise stdlib
+    with compact separators — identical output either way.
+    """
+    if _json_parser is json:
+        return json.dumps(obj, separators=(",", ":"))
+    return _json_parser.dumps(obj).decode()
+
+
+async def call_llm_batch_async(
+    message_batches: list,
+    max_tokens: int = None,
+    return_exceptions: bool = True
+) -> list:
+    """
+    Fire several independent LLM calls concurrently and collect results.
+
+    Groq's server-side Batch API trades latency for cost with turnaround
+    measured in hours — unusable for an interactive pipeline that answers
+    in 30-90 seconds. Client-side batching gets the same
+    max-of-latencies wall clock for a group of independent prompts, and
+    each call still goes through the response cache and retry logic.
+
+    Args:
+        message_batches: List of chat-message lists, one per call
+        max_tokens: Override default max tokens (applied to every call)
+        return_exceptions: If True (default), a failed call yields its
+            exception in the result list instead of aborting the batch
+
+    Returns:
+        List of responses in the same order as message_batches
+    """
+    if not message_batches:
+        return []
+
+    return await asyncio.gather(
+        *(call_llm_async(messages, max_tokens=max_tokens) for messages in message_batches),
+        return_exceptions=return_exceptions
+    )
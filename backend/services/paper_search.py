@@ -17,6 +17,7 @@ Returns a list of PaperResult dataclass objects with a unified schema.
 
 import asyncio
 import logging
+import re
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, asdict
 from typing import List
@@ -25,6 +26,58 @@ from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Parse API XML with lxml (libxml2, ~2-4x faster than stdlib
+# ElementTree) when it's installed, exactly like orjson in llm_service:
+# optional accelerator, stdlib fallback, identical API for the
+# findall/find calls below. Always fed bytes — lxml rejects str input
+# that carries an encoding declaration.
+try:
+    from lxml import etree as _xml_impl
+except ImportError:
+    _xml_impl = ET
+
+
+def _parse_xml(payload: bytes):
+    return _xml_impl.fromstring(payload)
+
+# arXiv wraps titles/abstracts with newlines and runs of spaces. One
+# compiled-regex pass collapses all of it, instead of chained
+# strip()/replace() passes that each allocate a new string and still
+# leave double spaces behind.
+_WS_RE = re.compile(r"\s+")
+
+
+def _clean_text(text: str) -> str:
+    """Collapse all whitespace runs to single spaces and trim."""
+    return _WS_RE.sub(" ", text).strip()
+
+
+# One pooled HTTP client for all searches, mirroring the shared client
+# in llm_service. Per-call AsyncClient instances paid a fresh TCP+TLS
+# handshake on every search; keep-alive connections make repeat queries
+# (and PubMed's back-to-back ESearch→EFetch pair) reuse sockets.
+# Created lazily so importing this module never opens connections;
+# closed from FastAPI's shutdown hook.
+_http_client = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=30,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+        )
+    return _http_client
+
+
+async def aclose_http_client():
+    """Close the shared search client. Safe to call when never opened."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 @dataclass
 class PaperResult:
@@ -58,12 +111,12 @@ async def _search_arxiv(query: str, max_results: int = None) -> List[PaperResult
 
     papers = []
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
+        client = _get_http_client()
+        response = await client.get(url, params=params)
+        response.raise_for_status()
 
         # Parse Atom XML
-        root = ET.fromstring(response.text)
+        root = _parse_xml(response.content)
         ns = {"atom": "http://www.w3.org/2005/Atom"}
 
         for entry in root.findall("atom:entry", ns):
@@ -78,8 +131,8 @@ async def _search_arxiv(query: str, max_results: int = None) -> List[PaperResult
                     authors.append(name.text.strip())
 
             papers.append(PaperResult(
-                title=title.text.strip().replace("\n", " ") if title is not None and title.text else "Untitled",
-                abstract=summary.text.strip().replace("\n", " ") if summary is not None and summary.text else "",
+                title=_clean_text(title.text) if title is not None and title.text else "Untitled",
+                abstract=_clean_text(summary.text) if summary is not None and summary.text else "",
                 authors=authors,
                 url=link.text.strip() if link is not None and link.text else "",
                 source="arxiv"
@@ -104,39 +157,40 @@ async def _search_pubmed(query: str, max_results: int = None) -> List[PaperResul
     papers = []
 
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            # Step 1: ESearch — get matching paper IDs
-            search_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
-            search_params = {
-                "db": "pubmed",
-                "term": query,
-                "retmax": max_results,
-                "retmode": "json",
-                "sort": "relevance"
-            }
-
-            search_resp = await client.get(search_url, params=search_params)
-            search_resp.raise_for_status()
-            search_data = search_resp.json()
-
-            id_list = search_data.get("esearchresult", {}).get("idlist", [])
-            if not id_list:
-                logger.info(f"PubMed: No results for query: {query}")
-                return papers
-
-            # Step 2: EFetch — get full records for those IDs
-            fetch_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
-            fetch_params = {
-                "db": "pubmed",
-                "id": ",".join(id_list),
-                "retmode": "xml"
-            }
-
-            fetch_resp = await client.get(fetch_url, params=fetch_params)
-            fetch_resp.raise_for_status()
+        client = _get_http_client()
+
+        # Step 1: ESearch — get matching paper IDs
+        search_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+        search_params = {
+            "db": "pubmed",
+            "term": query,
+            "retmax": max_results,
+            "retmode": "json",
+            "sort": "relevance"
+        }
+
+        search_resp = await client.get(search_url, params=search_params)
+        search_resp.raise_for_status()
+        search_data = search_resp.json()
+
+        id_list = search_data.get("esearchresult", {}).get("idlist", [])
+        if not id_list:
+            logger.info(f"PubMed: No results for query: {query}")
+            return papers
+
+        # Step 2: EFetch — get full records for those IDs
+        fetch_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+        fetch_params = {
+            "db": "pubmed",
+            "id": ",".join(id_list),
+            "retmode": "xml"
+        }
+
+        fetch_resp = await client.get(fetch_url, params=fetch_params)
+        fetch_resp.raise_for_status()
 
         # Parse PubMed XML
-        root = ET.fromstring(fetch_resp.text)
+        root = _parse_xml(fetch_resp.content)
 
         for article in root.findall(".//PubmedArticle"):
             # Title
@@ -209,3 +263,48 @@ async def search_papers(query: str) -> List[PaperResult]:
 
     logger.info(f"Total papers found: {len(results)} for query: {query}")
     return results
+
+
+# Cap on in-flight HTTP requests when fanning out many reformulated
+# queries — polite to arXiv/NCBI (both rate-limit aggressive clients)
+# while still collapsing N queries to roughly one round-trip of latency.
+_BATCH_CONCURRENCY = 8
+
+
+async def search_papers_batch(queries: List[str]) -> List[PaperResult]:
+    """
+    Search arXiv and PubMed for several queries concurrently.
+
+    Every (query, source) pair runs as its own task under a shared
+    semaphore, so a handful of reformulated queries costs about as much
+    wall time as one. Results are deduplicated by URL (falling back to
+    title for entries without one) since reformulations of the same
+    question frequently surface the same papers.
+    """
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def _bounded(coro):
+        async with semaphore:
+            return await coro
+
+    tasks = []
+    for query in queries:
+        tasks.append(_bounded(_search_arxiv(query)))
+        tasks.append(_bounded(_search_pubmed(query)))
+
+    # The per-source functions already catch and log their own failures,
+    # returning [] — so a failed search degrades instead of propagating.
+    batches = await asyncio.gather(*tasks)
+
+    results = []
+    seen = set()
+    for batch in batches:
+        for paper in batch:
+            key = paper.url or paper.title.lower()
+            if key in seen:
+                continue
+            seen.add(key)
+            results.append(paper)
+
+    logger.info(f"Batch search: {len(results)} unique papers for {len(queries)} queries")
+    return results
@@ -76,10 +76,12 @@ class ApiClient {
     }
 
     // ── Papers ────────────────────────────────────────────
-    async uploadPaper(workspaceId: number, file: File): Promise<PaperItem> {
+    async uploadPapers(workspaceId: number, files: File[]): Promise<PaperItem[]> {
         const form = new FormData();
-        form.append('file', file);
-        const { data } = await this.http.post<PaperItem>(
+        for (const file of files) {
+            form.append('files', file);
+        }
+        const { data } = await this.http.post<PaperItem[]>(
             `/papers/${workspaceId}`,
             form,
             { headers: { 'Content-Type': 'multipart/form-data' } }
@@ -35,16 +35,22 @@ export default function PapersPage() {
         setUploading(true);
         setError('');
 
+        const pdfs: File[] = [];
         for (let i = 0; i < files.length; i++) {
             const file = files[i];
             if (!file.name.endsWith('.pdf')) {
                 setError(`"${file.name}" is not a PDF file`);
                 continue;
             }
+            pdfs.push(file);
+        }
+
+        // All valid files go up in a single request
+        if (pdfs.length > 0) {
             try {
-                await api.uploadPaper(activeWorkspace.id, file);
+                await api.uploadPapers(activeWorkspace.id, pdfs);
             } catch {
-                setError(`Failed to upload "${file.name}"`);
+                setError('Failed to upload papers');
             }
         }
         setUploading(false);
@@ -1,9 +1,15 @@
 import os
+import re
 import logging
 import dotenv
 dotenv.load_dotenv()
 logging.basicConfig(level=logging.WARNING)
 
+# Markdown code fences the LLM sometimes wraps Cypher in, with an
+# optional language tag (```cypher / ```json). Compiled once at module
+# scope instead of per question.
+_FENCE_RE = re.compile(r"```[a-zA-Z]*\n?")
+
 print("\n" + "="*60)
 print("  🧠 Knowledge Graph RAG — Q&A System")
 print("="*60)
@@ -92,10 +98,13 @@ def ask_question(question):
             cypher_response = cypher_chain.invoke({"schema": schema, "question": question})
             cypher_query = cypher_response.content.strip()
 
-            # Clean up the query (remove markdown code blocks if present)
-            if cypher_query.startswith("```"):
-                cypher_query = cypher_query.split("\n", 1)[1]  # Remove first line
-                cypher_query = cypher_query.rsplit("```", 1)[0]  # Remove last ```
+            # Clean up the query (remove markdown code blocks if present).
+            # The `in` guard skips the regex scan entirely on clean output
+            # (the common case at temperature 0), and the regex handles
+            # fences anywhere in the text — the old startswith check
+            # missed responses that led with prose before the fence.
+            if "```" in cypher_query:
+                cypher_query = _FENCE_RE.sub("", cypher_query)
             cypher_query = cypher_query.strip()
 
             print(f"\n🔍 Generated Cypher (attempt {attempt+1}):")
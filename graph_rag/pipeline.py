@@ -11,6 +11,35 @@ files_path = 'files'
 files = [files_path+'/'+file for file in os.listdir(files_path) if file.endswith('.pdf')]
 logging.info(f'List of PDF files: {files}')
 
+# Skip PDFs that were already ingested on a previous run. Re-running the
+# pipeline on the same folder is common (adding one new paper), and
+# parsing + LLM extraction dominate the cost — so we remember each file
+# by content hash in a sidecar and only process genuinely new content.
+# Keyed on the bytes, not the filename, so renamed duplicates still skip.
+import hashlib
+import json
+
+ingested_hashes_path = files_path + '/.ingested_hashes.json'
+
+def file_content_hash(file):
+    with open(file, 'rb') as fh:
+        return hashlib.sha256(fh.read()).hexdigest()
+
+try:
+    with open(ingested_hashes_path) as fh:
+        ingested_hashes = set(json.load(fh))
+except (FileNotFoundError, ValueError):
+    ingested_hashes = set()
+
+file_hashes = {file: file_content_hash(file) for file in files}
+already_ingested = [file for file in files if file_hashes[file] in ingested_hashes]
+files = [file for file in files if file_hashes[file] not in ingested_hashes]
+if already_ingested:
+    logging.info(f'Skipping {len(already_ingested)} already-ingested PDFs: {already_ingested}')
+if not files:
+    logging.info('No new PDFs to ingest — nothing to do')
+    raise SystemExit(0)
+
 # Instantiate the token text splitter
 logging.info('Instantiating the token text splitter')
 # from langchain.text_splitter import TokenTextSplitter
@@ -18,18 +47,49 @@ from langchain_text_splitters import TokenTextSplitter
 splitter = TokenTextSplitter(chunk_size=512, chunk_overlap=24)
 
 # Split the PDFs into chunks as Documents
+# Files are independent, so load+split runs across a thread pool —
+# pypdf parsing releases the GIL during I/O and each file is its own
+# unit of work, so a folder of PDFs loads in roughly the time of the
+# largest one instead of the sum.
 logging.info('Splitting the PDFs into chunks as Documents')
-from langchain_community.document_loaders import PyPDFLoader
-documents = []
+# Prefer PyMuPDFLoader (MuPDF, C) when pymupdf is installed — it extracts
+# plain text several times faster than the pure-Python pypdf backend and
+# we only need text, not layout. Fall back to PyPDFLoader so the
+# pipeline still runs without the extra dependency.
+from concurrent.futures import ThreadPoolExecutor
+try:
+    import fitz  # noqa: F401 — probe for pymupdf before importing its loader
+    from langchain_community.document_loaders import PyMuPDFLoader as PDFLoader
+    logging.info('Using PyMuPDFLoader for text extraction')
+except ImportError:
+    from langchain_community.document_loaders import PyPDFLoader as PDFLoader
+    logging.info('pymupdf not installed — falling back to PyPDFLoader')
 
-for file in files:
-    # Load the PDF file
-    pdf_loader = PyPDFLoader(file_path=file, extract_images=False)
-    # Split the PDF into Documents
-    files_documents = pdf_loader.load_and_split(text_splitter=splitter)
-    # Add the Documents to the list
-    documents.extend(files_documents)
+def load_and_split_file(file):
+    pdf_loader = PDFLoader(file_path=file, extract_images=False)
+    # lazy_load() yields one page Document at a time, so the splitter
+    # consumes pages as they are parsed instead of the whole PDF being
+    # materialized up front (load_and_split() does a full load() first).
+    # Peak memory per worker is one page plus the chunks, not the file.
+    files_documents = splitter.split_documents(pdf_loader.lazy_load())
     logging.info(f'Loaded and split {file} into {len(files_documents)} Documents')
+    return files_documents
+
+documents = []
+with ThreadPoolExecutor(max_workers=min(8, max(1, len(files)))) as pool:
+    # map() preserves file order so chunk ordering stays deterministic
+    for files_documents in pool.map(load_and_split_file, files):
+        documents.extend(files_documents)
+
+# Drop chunks with no extractable text before the LLM fan-out. Scanned
+# or image-only pages come back as empty/whitespace Documents, and each
+# one would still burn a rate-limited Groq extraction call to return an
+# empty graph.
+total_chunks = len(documents)
+documents = [doc for doc in documents if doc.page_content.strip()]
+if len(documents) < total_chunks:
+    logging.info(f'Skipping {total_chunks - len(documents)} empty chunks '
+                 f'(scanned/image-only pages) — {len(documents)} remain')
 
 # Instantiate LLM to use with the LLMGraphTransformer
 logging.info('Instantiating LLM to use with the LLMGraphTransformer')
@@ -281,31 +341,42 @@ from langchain_experimental.graph_transformers import LLMGraphTransformer
 llm_transformer = LLMGraphTransformer(llm=llm, prompt=chat_prompt)
 
 # Convert the Documents into Graph Documents
-# Process one at a time with delays to respect Groq's rate limits
-import time
-graph_documents = []
-total_docs = len(documents)
-for i, doc in enumerate(documents):
-    logging.info(f'Processing document {i+1}/{total_docs}...')
-    retries = 0
-    while retries < 5:
-        try:
-            result = llm_transformer.convert_to_graph_documents([doc])
-            graph_documents.extend(result)
-            break
-        except Exception as e:
-            if '429' in str(e) or 'rate_limit' in str(e).lower():
-                wait_time = 30 * (retries + 1)
-                logging.warning(f'Rate limited! Waiting {wait_time}s before retry...')
-                time.sleep(wait_time)
-                retries += 1
-            else:
-                logging.error(f'Error processing document {i+1}: {e}')
-                break
-    # Delay between documents to stay within rate limits
-    if i < total_docs - 1:
-        logging.info('Waiting 15s to respect rate limits...')
-        time.sleep(15)
+# Chunks are independent, so extraction fans out concurrently under a
+# semaphore instead of one-at-a-time with fixed 15s sleeps between
+# documents. The semaphore keeps us inside Groq's rate limits the same
+# way the sleeps did, but N documents now take roughly the latency of
+# N/concurrency calls instead of N calls plus 15s each.
+import asyncio
+
+MAX_CONCURRENT_EXTRACTIONS = int(os.getenv('GRAPH_MAX_CONCURRENCY', '4'))
+
+async def convert_documents(docs):
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXTRACTIONS)
+    total_docs = len(docs)
+
+    async def convert_one(i, doc):
+        async with semaphore:
+            for retries in range(5):
+                try:
+                    result = await llm_transformer.aconvert_to_graph_documents([doc])
+                    logging.info(f'Processed document {i+1}/{total_docs}')
+                    return result
+                except Exception as e:
+                    if '429' in str(e) or 'rate_limit' in str(e).lower():
+                        wait_time = 30 * (retries + 1)
+                        logging.warning(f'Rate limited! Waiting {wait_time}s before retry...')
+                        await asyncio.sleep(wait_time)
+                    else:
+                        logging.error(f'Error processing document {i+1}: {e}')
+                        return []
+            logging.error(f'Document {i+1} still rate limited after 5 retries — skipping')
+            return []
+
+    results = await asyncio.gather(*[convert_one(i, doc) for i, doc in enumerate(docs)])
+    # Flatten while preserving document order
+    return [graph_doc for result in results for graph_doc in result]
+
+graph_documents = asyncio.run(convert_documents(documents))
 
 # Instantiate the Neo4JGraph to persist the data
 logging.info('Instantiating the Neo4JGraph to persist the data')
@@ -322,4 +393,10 @@ graph.add_graph_documents(
   include_source=True
 )
 
+# Record the freshly ingested files only after the graph persist
+# succeeded, so a failed run retries them next time.
+ingested_hashes.update(file_hashes[file] for file in files)
+with open(ingested_hashes_path, 'w') as fh:
+    json.dump(sorted(ingested_hashes), fh)
+
 logging.info('Data pipeline completed successfully!')